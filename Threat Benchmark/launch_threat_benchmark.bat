@@ -0,0 +1,5 @@
+@echo off
+cd /d "%~dp0"
+echo Running threat extraction benchmark...
+python threat_benchmark.py --show-misses
+pause
@@ -0,0 +1,209 @@
+import argparse
+import ast
+import json
+import os
+import re
+import sqlite3
+import time
+import zlib
+
+# ========================================================================================
+# --- THREAT EXTRACTION BENCHMARK ---
+# ========================================================================================
+# Scores every copy of extract_threats_from_description() in the repo against a labeled
+# corpus of warning descriptions: wind/hail accuracy, throughput and worst-case latency.
+# The functions are lifted out of their scripts with ast (with the module-level constants
+# and helpers they use) so nothing has to be imported, configured or started.
+#
+# threat_corpus.jsonl is a small hand-labeled set covering the formats NWS uses. Build a
+# larger corpus of real descriptions from the alert archive (or recorded snapshots) with
+# --build-from-archive / --build-from-dir; those cases are labeled from the maxWindGust and
+# maxHailSize parameters NWS publishes alongside the text.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BASE_DIR)
+DEFAULT_CORPUS = os.path.join(BASE_DIR, "threat_corpus.jsonl")
+
+EXTRACTORS = {
+    "main": os.path.join(REPO_DIR, "weather_warning_monitoring.py"),
+    "ninja_fork": os.path.join(REPO_DIR, "WX Testing Area", "new_score_ninja_weather_warning_monitor_with_html.py")
+}
+
+NUMBER_PATTERN = re.compile(r'(\d*\.?\d+)')
+
+def load_extractor(path, name="extract_threats_from_description"):
+    """Compile a function plus the top-level definitions it references from a script, without importing it"""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    definitions = {}
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            definitions[node.name] = node
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    definitions[target.id] = node
+
+    # Walk the names the function uses, pulling in the constants and helpers they resolve to
+    needed = {}
+    pending = [name]
+    while pending:
+        node = definitions.get(pending.pop())
+        if node is None or id(node) in needed:
+            continue
+        needed[id(node)] = node
+        pending.extend(n.id for n in ast.walk(node) if isinstance(n, ast.Name))
+
+    module = ast.Module(body=sorted(needed.values(), key=lambda node: node.lineno), type_ignores=[])
+    namespace = {"re": re}
+    exec(compile(module, path, "exec"), namespace)
+    return namespace[name]
+
+def to_wind(value):
+    """Wind as integer mph from "60 MPH"-style text (None if absent)"""
+    if value and (match := NUMBER_PATTERN.search(str(value))):
+        return round(float(match.group(1))) or None
+    return None
+
+def to_hail(value):
+    """Hail as inches from '1.75"', ".75", "3/4" or a number (None if absent or zero)"""
+    if value is None:
+        return None
+    text = str(value)
+    if '/' in text:
+        numerator, _, denominator = text.strip('"').partition('/')
+        try:
+            return round(int(numerator) / int(denominator), 2) or None
+        except (ValueError, ZeroDivisionError):
+            return None
+    if match := NUMBER_PATTERN.search(text):
+        return round(float(match.group(1)), 2) or None
+    return None
+
+def load_corpus(path):
+    """Read labeled cases ({"id", "description", "wind", "hail"}) from a JSONL file"""
+    cases = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                case = json.loads(line)
+                case["wind"] = to_wind(case.get("wind"))
+                case["hail"] = to_hail(case.get("hail"))
+                cases.append(case)
+    return cases
+
+def label_feature(feature):
+    """Turn an NWS alert feature into a corpus case labeled from its parameters, or None if unlabeled"""
+    props = feature.get('properties') or {}
+    params = props.get('parameters') or {}
+    description = props.get('description')
+    if not description or not (params.get('maxWindGust') or params.get('maxHailSize')):
+        return None
+    return {
+        "id": feature.get('id') or props.get('id'),
+        "description": description,
+        "wind": to_wind((params.get('maxWindGust') or [None])[0]),
+        "hail": to_hail((params.get('maxHailSize') or [None])[0]),
+        "note": props.get('event', '')
+    }
+
+def iter_archive_features(archive_path):
+    """Yield every alert feature stored in the monitor's alert archive"""
+    conn = sqlite3.connect(archive_path)
+    try:
+        for (blob,) in conn.execute("SELECT feature FROM alerts"):
+            yield json.loads(zlib.decompress(blob))
+    finally:
+        conn.close()
+
+def iter_snapshot_features(directory):
+    """Yield every feature in a directory of recorded GeoJSON snapshots"""
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith('.json'):
+            with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+                yield from json.load(f).get('features', [])
+
+def build_corpus(features, output_path):
+    """Write a labeled corpus of unique descriptions and return how many cases it has"""
+    seen = set()
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for feature in features:
+            case = label_feature(feature)
+            if case is None or case["description"] in seen:
+                continue
+            seen.add(case["description"])
+            f.write(json.dumps(case) + "\n")
+            count += 1
+    return count
+
+def benchmark(extract, cases, repeat):
+    """Score one extractor: accuracy per field plus throughput and per-description latency"""
+    results = {"wind_correct": 0, "hail_correct": 0, "both_correct": 0, "misses": []}
+    latencies = []
+
+    for case in cases:
+        threats = extract(case["description"])
+        wind, hail = to_wind(threats.get('wind')), to_hail(threats.get('hail'))
+        wind_ok = wind == case["wind"]
+        hail_ok = hail == case["hail"]
+        results["wind_correct"] += wind_ok
+        results["hail_correct"] += hail_ok
+        results["both_correct"] += wind_ok and hail_ok
+        if not (wind_ok and hail_ok):
+            results["misses"].append((case, wind, hail))
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            extract(case["description"])
+        latencies.append((time.perf_counter() - start) / repeat)
+
+    total_time = sum(latencies)
+    latencies.sort()
+    results["throughput"] = len(cases) / total_time if total_time else 0
+    results["p50_ms"] = latencies[len(latencies) // 2] * 1000
+    results["p99_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    results["max_ms"] = latencies[-1] * 1000
+    return results
+
+def print_report(name, results, total, show_misses):
+    """Print one extractor's accuracy and speed"""
+    print(f"\n=== {name} ===")
+    print(f"  Wind correct: {results['wind_correct']}/{total} ({results['wind_correct'] / total:.1%})")
+    print(f"  Hail correct: {results['hail_correct']}/{total} ({results['hail_correct'] / total:.1%})")
+    print(f"  Both correct: {results['both_correct']}/{total} ({results['both_correct'] / total:.1%})")
+    print(f"  Throughput:   {results['throughput']:,.0f} descriptions/sec")
+    print(f"  Latency:      p50 {results['p50_ms']:.3f} ms, p99 {results['p99_ms']:.3f} ms, worst {results['max_ms']:.3f} ms")
+    if show_misses:
+        for case, wind, hail in results["misses"]:
+            print(f"  MISS {case['id']}: wind {wind} (expected {case['wind']}), hail {hail} (expected {case['hail']}) - {case.get('note', '')}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the wind/hail threat extractors against a labeled corpus")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Labeled JSONL corpus to score against")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per description")
+    parser.add_argument("--extractor", action="append", choices=sorted(EXTRACTORS), help="Extractor(s) to run (default: all)")
+    parser.add_argument("--show-misses", action="store_true", help="List every case an extractor got wrong")
+    parser.add_argument("--build-from-archive", metavar="DB", help="Build --corpus from an alert archive database, then exit")
+    parser.add_argument("--build-from-dir", metavar="DIR", help="Build --corpus from a directory of recorded snapshots, then exit")
+    args = parser.parse_args()
+
+    if args.build_from_archive or args.build_from_dir:
+        features = iter_archive_features(args.build_from_archive) if args.build_from_archive else iter_snapshot_features(args.build_from_dir)
+        count = build_corpus(features, args.corpus)
+        print(f"Wrote {count} labeled descriptions to {args.corpus}")
+        return
+
+    cases = load_corpus(args.corpus)
+    print(f"Corpus: {args.corpus} ({len(cases)} descriptions, {args.repeat} timed calls each)")
+    for name in args.extractor or sorted(EXTRACTORS):
+        try:
+            extract = load_extractor(EXTRACTORS[name])
+        except Exception as e:
+            print(f"\n=== {name} ===\n  Could not load extractor: {e}")
+            continue
+        print_report(name, benchmark(extract, cases, args.repeat), len(cases), args.show_misses)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 
 import requests
+import json
+import os
+import sys
 import time
 from datetime import datetime
 
@@ -23,6 +26,10 @@ alert_colors = {
 default_dark = "#6A5ACD"
 default_light = "#9370DB"
 
+# Shared feed reader lives next to alert_feed_daemon.py in the main folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from alert_feed_reader import load_alert_feed
+
 def generate_html(alert_type, locations, threats, dark, light):
     return f'''
 <html>
@@ -114,11 +121,13 @@ def match_alert_color(alert_type):
 
 def fetch_active_alert():
     try:
-        r = requests.get("https://api.weather.gov/alerts/active", timeout=10)
-        data = r.json()
-        if "features" not in data or not data["features"]:
+        features = load_alert_feed()
+        if features is None:
+            r = requests.get("https://api.weather.gov/alerts/active", timeout=10)
+            features = r.json().get("features")
+        if not features:
             return None
-        alert = data["features"][0]["properties"]
+        alert = features[0]["properties"]
         return {
             "alert_type": alert["event"],
             "locations": alert.get("areaDesc", "N/A").replace(";", " •"),
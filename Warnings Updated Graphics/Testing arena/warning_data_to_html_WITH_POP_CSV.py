@@ -1,40 +1,60 @@
 
 import requests
+import json
+import os
+import sys
 import time
 from datetime import datetime
 import pytz
-import pandas as pd
+import csv
 
-# Load county population CSV
-county_df = pd.read_csv("county_population.csv")
+# Shared feed reader lives next to alert_feed_daemon.py in the main folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from alert_feed_reader import load_alert_feed
 
-def get_total_population(area_desc):
-    counties = [c.strip() for c in area_desc.split(";")]
+# Offline population tables, loaded once: SAME/UGC codes from the main folder's index, plus
+# county_population.csv by "county, state" name for alerts without a geocode
+POPULATION_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "population_index.csv")
+COUNTY_POPULATION_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "county_population.csv")
+
+def load_population_tables():
+    """Return ({code: population}, {(county, state): population})"""
+    codes = {}
+    names = {}
+    try:
+        with open(POPULATION_INDEX_PATH, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                codes[row["code"]] = int(row["population"])
+    except Exception as e:
+        print("Population index not loaded:", e)
+    try:
+        with open(COUNTY_POPULATION_PATH, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                names[(row["county"].lower(), row["state"].upper())] = int(row["population"])
+    except Exception as e:
+        print("County population CSV not loaded:", e)
+    return codes, names
+
+population_by_code, population_by_name = load_population_tables()
+
+def get_total_population(geocode, area_desc):
+    # SAME (county FIPS) first, then UGC county/zone codes - one dict lookup per code
+    for codes in (geocode.get("SAME"), geocode.get("UGC")):
+        populations = [population_by_code[code] for code in codes or [] if code in population_by_code]
+        if populations:
+            return sum(populations)
+
+    # No geocode match: fall back to county names
     total = 0
-    for c in counties:
+    for c in area_desc.split(";"):
+        c = c.strip()
         # Remove directional prefixes like Eastern, Western, Northern, Southern
         for prefix in ["Eastern ", "Western ", "Northern ", "Southern "]:
             if c.startswith(prefix):
-                c = c.replace(prefix, "")
+                c = c[len(prefix):]
         if "," in c:
-            county_name, state = [x.strip() for x in c.split(",")]
-            match = county_df[
-                (county_df['county'].str.lower() == county_name.lower()) &
-                (county_df['state'].str.upper() == state.upper())
-            ]
-            if not match.empty:
-                total += int(match.iloc[0]['population'])
-    return total if total > 0 else None
-(area_desc):
-    counties = [c.strip() for c in area_desc.split(";")]
-    total = 0
-    for c in counties:
-        # Remove directional prefixes like Eastern, Western, Northern, Southern
-        for prefix in ["Eastern ", "Western ", "Northern ", "Southern "]:
-            if c.startswith(prefix):
-                c = c.replace(prefix, "")
-        if c in county_population:
-            total += county_population[c]
+            county_name, state = [x.strip() for x in c.split(",", 1)]
+            total += population_by_name.get((county_name.lower(), state.upper()), 0)
     return total if total > 0 else None
 
 def get_warning_icon(warning_type):
@@ -106,7 +126,7 @@ def create_html(data, output_path):
     wind = data.get('wind', "N/A")
     expires_fmt = convert_to_chicago_time(data.get("expires", "N/A"))
     dark_color, light_color = get_color_scheme(data['type'])
-    population = get_total_population(data['area'])
+    population = get_total_population(data.get('geocode', {}), data['area'])
 
     html_content = f"""
     <html>
@@ -188,9 +208,11 @@ def fetch_nws_alert():
     url = "https://api.weather.gov/alerts/active"
     headers = {"User-Agent": "WeatherWiseBot/1.0 (your_email@example.com)"}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        alerts = response.json().get("features", [])
+        alerts = load_alert_feed()
+        if alerts is None:
+            response = requests.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+            alerts = response.json().get("features", [])
         for alert in alerts:
             props = alert.get("properties", {})
             if props.get("status") == "Actual":
@@ -202,6 +224,7 @@ def fetch_nws_alert():
                     "hail": props.get("hailSize", "N/A"),
                     "wind": props.get("windGust", "N/A"),
                     "damageThreat": props.get("severity", "UNKNOWN"),
+                    "geocode": props.get("geocode", {}),
                 }
     except Exception as e:
         print("Fetch error:", e)
@@ -1,21 +1,29 @@
 
 import requests
 import json
+import os
+import sys
 from datetime import datetime
 
+# Shared feed reader lives next to alert_feed_daemon.py in the main folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from alert_feed_reader import load_alert_feed
+
 def fetch_and_save_latest_warning():
-    url = "https://api.weather.gov/alerts/active"
-    headers = {
-        "User-Agent": "WeatherWiseBot (admin@example.com)"
-    }
+    alerts = load_alert_feed()
+    if alerts is None:
+        url = "https://api.weather.gov/alerts/active"
+        headers = {
+            "User-Agent": "WeatherWiseBot (admin@example.com)"
+        }
 
-    response = requests.get(url, headers=headers)
+        response = requests.get(url, headers=headers)
 
-    if response.status_code != 200:
-        print(f"Failed to fetch data: {response.status_code}")
-        return
+        if response.status_code != 200:
+            print(f"Failed to fetch data: {response.status_code}")
+            return
 
-    alerts = response.json().get("features", [])
+        alerts = response.json().get("features", [])
     if not alerts:
         print("No alerts found.")
         return
@@ -1,10 +1,20 @@
 
 import requests
 import json
+import os
+import sys
 import time
 from datetime import datetime
 
+# Shared feed reader lives next to alert_feed_daemon.py in the main folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from alert_feed_reader import load_alert_feed
+
 def fetch_nws_alerts():
+    alerts = load_alert_feed()
+    if alerts is not None:
+        return alerts
+
     url = "https://api.weather.gov/alerts/active"
     try:
         response = requests.get(url, timeout=10)
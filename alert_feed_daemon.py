@@ -0,0 +1,120 @@
+import json
+import os
+import sys
+import time
+import logging
+import requests
+
+# ========================================================================================
+# --- SHARED NWS ALERT FEED DAEMON ---
+# ========================================================================================
+# Fetches the national /alerts/active feed once for every overlay script and the main
+# monitor, normalizes it and publishes it as a snapshot file that is replaced atomically.
+# Subscribers read the file instead of downloading the feed themselves; when the daemon is
+# not running (file missing or stale) they fall back to their own direct fetch.
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', stream=sys.stdout)
+logger = logging.getLogger("alert_feed")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_CONFIG = {
+    "NWS_USER_AGENT": "WeatherWiseStreamBot/1.0 (YourName, yourcontact@example.com)",
+    "ALERT_FEED_PATH": "alert_feed.json",   # Snapshot file, relative to this folder
+    "ALERT_FEED_INTERVAL_SECONDS": 10       # How often the daemon polls NWS
+}
+
+NWS_API_URL = "https://api.weather.gov/alerts/active"
+
+# Properties carried into the snapshot - everything any overlay script reads
+FEED_PROPERTY_FIELDS = (
+    "id", "event", "status", "messageType", "severity", "certainty", "urgency",
+    "headline", "description", "instruction", "areaDesc", "senderName",
+    "sent", "effective", "onset", "expires", "ends",
+    "parameters", "geocode", "references"
+)
+
+def load_config():
+    """Read the shared settings from config.json, falling back to defaults"""
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(os.path.join(BASE_DIR, 'config.json'), 'r') as f:
+            saved = json.load(f)
+        config.update({k: saved[k] for k in DEFAULT_CONFIG if k in saved})
+    except Exception as e:
+        logger.warning(f"Could not read config.json ({e}), using defaults")
+    return config
+
+def normalize_feature(feature):
+    """Reduce an NWS alert feature to the fields subscribers use, keeping the GeoJSON shape"""
+    props = feature.get('properties') or {}
+    return {
+        "id": feature.get('id') or props.get('id'),
+        "geometry": feature.get('geometry'),
+        "properties": {k: props[k] for k in FEED_PROPERTY_FIELDS if k in props}
+    }
+
+def write_snapshot(path, snapshot):
+    """Atomically replace the snapshot file so readers never see a partial write"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f)
+    os.replace(temp_path, path)
+
+def run_daemon():
+    """Poll NWS and publish a snapshot (plus the delta from the previous one) after every change"""
+    config = load_config()
+    feed_path = os.path.join(BASE_DIR, config["ALERT_FEED_PATH"])
+    headers = {"User-Agent": config["NWS_USER_AGENT"], "Accept": "application/geo+json"}
+
+    session = requests.Session()
+    etag = None
+    last_modified = None
+    sequence = 0
+    previous_ids = set()
+    features = []
+    delta = {"added": [], "removed": []}  # Change that produced the current sequence number
+
+    logger.info(f"Publishing NWS alert feed to {feed_path}")
+    while True:
+        try:
+            request_headers = dict(headers)
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+            r = session.get(NWS_API_URL, headers=request_headers, timeout=15)
+            if r.status_code != 304:
+                r.raise_for_status()
+                features = [normalize_feature(f) for f in r.json().get('features', [])]
+                etag = r.headers.get("ETag")
+                last_modified = r.headers.get("Last-Modified")
+
+                current_ids = {f["id"] for f in features}
+                added = sorted(current_ids - previous_ids)
+                removed = sorted(previous_ids - current_ids)
+                previous_ids = current_ids
+                if added or removed or sequence == 0:
+                    sequence += 1
+                    delta = {"added": added, "removed": removed}
+                    logger.info(f"Feed #{sequence}: {len(features)} alerts (+{len(added)} / -{len(removed)})")
+
+            # Rewrite even when unchanged so subscribers can tell the daemon is alive
+            write_snapshot(feed_path, {
+                "sequence": sequence,
+                "updated": time.time(),
+                "source_last_modified": last_modified,
+                "delta": delta,
+                "features": features
+            })
+        except Exception as e:
+            logger.error(f"Alert feed update failed: {e}")
+
+        time.sleep(config["ALERT_FEED_INTERVAL_SECONDS"])
+
+if __name__ == "__main__":
+    try:
+        run_daemon()
+    except KeyboardInterrupt:
+        logger.info("Alert feed daemon stopped")
@@ -0,0 +1,42 @@
+import json
+import os
+import time
+
+# ========================================================================================
+# --- SHARED NWS ALERT FEED READER ---
+# ========================================================================================
+# The subscriber side of alert_feed_daemon.py for the overlay scripts. Feed location and
+# the age past which the daemon counts as down come from config.json, the same settings
+# the main monitor uses. The ALERT_FEED_PATH environment variable overrides the path.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_CONFIG = {
+    "ALERT_FEED_PATH": "alert_feed.json",   # Snapshot file, relative to this folder
+    "ALERT_FEED_MAX_AGE_SECONDS": 60        # Older snapshots mean the daemon is down
+}
+
+def load_config():
+    """Read the feed settings from config.json, falling back to defaults"""
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(os.path.join(BASE_DIR, 'config.json'), 'r') as f:
+            saved = json.load(f)
+        config.update({k: saved[k] for k in DEFAULT_CONFIG if k in saved})
+    except Exception:
+        pass
+    return config
+
+CONFIG = load_config()
+ALERT_FEED_PATH = os.environ.get("ALERT_FEED_PATH", os.path.join(BASE_DIR, CONFIG["ALERT_FEED_PATH"]))
+
+def load_alert_feed():
+    """Return the alert features from the shared feed, or None if the daemon isn't running"""
+    try:
+        with open(ALERT_FEED_PATH, "r", encoding="utf-8") as f:
+            feed = json.load(f)
+        if time.time() - feed.get("updated", 0) > CONFIG["ALERT_FEED_MAX_AGE_SECONDS"]:
+            return None
+        return feed.get("features", [])
+    except Exception:
+        return None
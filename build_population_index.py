@@ -0,0 +1,95 @@
+import csv
+import os
+import sys
+from collections import defaultdict
+
+# ========================================================================================
+# --- POPULATION INDEX BUILDER ---
+# ========================================================================================
+# Builds population_index.csv, the offline table the monitor uses to resolve an alert's
+# population from its geocode (SAME county FIPS and UGC county/zone codes) without any
+# network calls. Inputs:
+#   1. Census county population estimates (e.g. co-est2023-alldata.csv from census.gov)
+#   2. Optional: the NWS zone-county correlation file (bp_*.dbx from weather.gov/gis/ZoneCounty)
+#      so public forecast zones (UGC "OKZ025") resolve too. A county shared by several
+#      zones has its population split evenly between them.
+#
+# Usage: python build_population_index.py co-est2023-alldata.csv [bp_05mr24.dbx]
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(BASE_DIR, "population_index.csv")
+
+STATE_FIPS = {
+    "01": "AL", "02": "AK", "04": "AZ", "05": "AR", "06": "CA", "08": "CO", "09": "CT", "10": "DE",
+    "11": "DC", "12": "FL", "13": "GA", "15": "HI", "16": "ID", "17": "IL", "18": "IN", "19": "IA",
+    "20": "KS", "21": "KY", "22": "LA", "23": "ME", "24": "MD", "25": "MA", "26": "MI", "27": "MN",
+    "28": "MS", "29": "MO", "30": "MT", "31": "NE", "32": "NV", "33": "NH", "34": "NJ", "35": "NM",
+    "36": "NY", "37": "NC", "38": "ND", "39": "OH", "40": "OK", "41": "OR", "42": "PA", "44": "RI",
+    "45": "SC", "46": "SD", "47": "TN", "48": "TX", "49": "UT", "50": "VT", "51": "VA", "53": "WA",
+    "54": "WV", "55": "WI", "56": "WY", "60": "AS", "66": "GU", "69": "MP", "72": "PR", "78": "VI"
+}
+
+def read_county_populations(census_path):
+    """Return {5-digit county FIPS: (population, "County, ST")} from a Census estimates file"""
+    counties = {}
+    with open(census_path, 'r', encoding='latin-1', newline='') as f:
+        reader = csv.DictReader(f)
+        estimate_column = sorted(c for c in reader.fieldnames if c.startswith("POPESTIMATE") and c[11:].isdigit())[-1]
+        print(f"Using {estimate_column} from {census_path}")
+        for row in reader:
+            if row.get("SUMLEV") != "050":  # County rows only (040 = state totals)
+                continue
+            state_fips = row["STATE"].zfill(2)
+            if state_fips not in STATE_FIPS:
+                continue
+            fips = state_fips + row["COUNTY"].zfill(3)
+            name = row["CTYNAME"].replace(" County", "").replace(" Parish", "")
+            counties[fips] = (int(row[estimate_column]), f"{name}, {STATE_FIPS[state_fips]}")
+    return counties
+
+def read_zone_populations(zone_path, counties):
+    """Return {UGC zone code: (population, name)} by spreading each county over the zones it maps to"""
+    zones_by_county = defaultdict(set)
+    zone_names = {}
+    with open(zone_path, 'r', encoding='latin-1') as f:
+        for line in f:
+            fields = line.rstrip('\n').split('|')
+            if len(fields) < 7:
+                continue
+            state, zone, _, name, _, _, fips = fields[:7]
+            ugc = f"{state}Z{zone.zfill(3)}"
+            zones_by_county[fips.zfill(5)].add(ugc)
+            zone_names[ugc] = f"{name}, {state}"
+
+    zones = defaultdict(float)
+    for fips, ugcs in zones_by_county.items():
+        if fips in counties:
+            for ugc in ugcs:
+                zones[ugc] += counties[fips][0] / len(ugcs)
+    return {ugc: (round(population), zone_names[ugc]) for ugc, population in zones.items()}
+
+def write_index(counties, zones):
+    """Write SAME ("0" + county FIPS), UGC county ("OKC109") and UGC zone rows"""
+    rows = []
+    for fips, (population, name) in counties.items():
+        rows.append(("0" + fips, population, name))
+        rows.append((f"{STATE_FIPS[fips[:2]]}C{fips[2:]}", population, name))
+    rows.extend((ugc, population, name) for ugc, (population, name) in zones.items())
+    rows.sort()
+
+    with open(OUTPUT_PATH, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(["code", "population", "name"])
+        writer.writerows(rows)
+    print(f"Wrote {len(rows)} codes ({len(counties)} counties, {len(zones)} zones) to {OUTPUT_PATH}")
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python build_population_index.py <census county estimates csv> [nws zone-county .dbx]")
+        sys.exit(1)
+    counties = read_county_populations(sys.argv[1])
+    zones = read_zone_populations(sys.argv[2], counties) if len(sys.argv) > 2 else {}
+    write_index(counties, zones)
+
+if __name__ == "__main__":
+    main()
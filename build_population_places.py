@@ -0,0 +1,69 @@
+import csv
+import os
+import pickle
+import sys
+from array import array
+
+# ========================================================================================
+# --- POPULATION PLACES BUILDER ---
+# ========================================================================================
+# Builds population_places.pkl: population points the monitor loads into a shapely STRtree
+# so a warning polygon can be matched against the people actually inside it, not whole
+# counties. Any CSV with latitude/longitude/population columns works, e.g. the Census
+# block-group centers of population (CenPop2020_Mean_BG.txt) or a table of incorporated
+# places. Use one layer per area - block groups and places overlap, so combining them for
+# the same area counts people twice.
+#
+# Usage: python build_population_places.py CenPop2020_Mean_BG.txt [more.csv ...]
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(BASE_DIR, "population_places.pkl")
+
+LAT_COLUMNS = ("LATITUDE", "LAT", "INTPTLAT")
+LON_COLUMNS = ("LONGITUDE", "LON", "LONG", "INTPTLONG")
+POP_COLUMNS = ("POPULATION", "POP", "POP100")
+
+def find_column(fieldnames, candidates):
+    """Match one of the candidate column names, ignoring case and padding"""
+    columns = {name.strip().upper(): name for name in fieldnames}
+    for candidate in candidates:
+        if candidate in columns:
+            return columns[candidate]
+    raise ValueError(f"None of {candidates} in columns {fieldnames}")
+
+def read_points(path, lons, lats, populations):
+    """Append every populated point in a CSV to the output arrays"""
+    count = 0
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        lat_column = find_column(reader.fieldnames, LAT_COLUMNS)
+        lon_column = find_column(reader.fieldnames, LON_COLUMNS)
+        pop_column = find_column(reader.fieldnames, POP_COLUMNS)
+        for row in reader:
+            try:
+                population = int(float(row[pop_column]))
+                if population <= 0:
+                    continue
+                lats.append(float(row[lat_column]))
+                lons.append(float(row[lon_column]))
+                populations.append(population)
+                count += 1
+            except (TypeError, ValueError):
+                continue
+    print(f"{path}: {count} points")
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python build_population_places.py <points.csv> [more.csv ...]")
+        sys.exit(1)
+
+    lons, lats, populations = array('d'), array('d'), array('l')
+    for path in sys.argv[1:]:
+        read_points(path, lons, lats, populations)
+
+    with open(OUTPUT_PATH, 'wb') as f:
+        pickle.dump({"version": 1, "lons": lons, "lats": lats, "populations": populations}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"Wrote {len(populations)} points ({sum(populations):,} people) to {OUTPUT_PATH}")
+
+if __name__ == "__main__":
+    main()
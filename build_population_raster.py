@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+import numpy as np
+
+# ========================================================================================
+# --- POPULATION RASTER BUILDER ---
+# ========================================================================================
+# Converts a gridded population-count dataset in ESRI ASCII grid format (GPW v4 and
+# WorldPop both publish one, ~1km cells) into population_raster.npy plus a small JSON
+# header. The monitor memory-maps the .npy and sums the cells whose centers fall inside a
+# warning polygon. Rows are streamed, so a global grid converts in bounded memory, and an
+# optional bounding box clips it down (the default keeps CONUS only).
+#
+# Usage: python build_population_raster.py <grid.asc> [west,south,east,north]
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(BASE_DIR, "population_raster.npy")
+DEFAULT_BBOX = (-125.0, 24.0, -66.0, 50.0)  # Continental US
+
+def read_header(f):
+    """Read the six-line ESRI ASCII grid header"""
+    header = {}
+    for _ in range(6):
+        key, value = f.readline().split()
+        header[key.lower()] = float(value)
+    cell = header["cellsize"]
+    # Grids may give the lower-left corner or the lower-left cell center
+    west = header["xllcorner"] if "xllcorner" in header else header["xllcenter"] - cell / 2
+    south = header["yllcorner"] if "yllcorner" in header else header["yllcenter"] - cell / 2
+    return {
+        "rows": int(header["nrows"]),
+        "cols": int(header["ncols"]),
+        "west": west,
+        "north": south + int(header["nrows"]) * cell,
+        "cell_size": cell,
+        "nodata": header.get("nodata_value", -9999.0)
+    }
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python build_population_raster.py <grid.asc> [west,south,east,north]")
+        sys.exit(1)
+    bbox = tuple(float(v) for v in sys.argv[2].split(',')) if len(sys.argv) > 2 else DEFAULT_BBOX
+    west, south, east, north = bbox
+
+    with open(sys.argv[1], 'r') as f:
+        header = read_header(f)
+        cell = header["cell_size"]
+
+        # Clip window in source rows/columns
+        row0 = max(int((header["north"] - north) / cell), 0)
+        row1 = min(int(np.ceil((header["north"] - south) / cell)), header["rows"])
+        col0 = max(int((west - header["west"]) / cell), 0)
+        col1 = min(int(np.ceil((east - header["west"]) / cell)), header["cols"])
+        if row0 >= row1 or col0 >= col1:
+            print("Bounding box does not overlap the grid")
+            sys.exit(1)
+
+        grid = np.lib.format.open_memmap(OUTPUT_PATH, mode='w+', dtype=np.float32, shape=(row1 - row0, col1 - col0))
+        for row in range(row1):
+            line = f.readline()
+            if row < row0:
+                continue
+            values = np.array(line.split()[col0:col1], dtype=np.float32)
+            values[(values == header["nodata"]) | (values < 0)] = 0
+            grid[row - row0] = values
+        grid.flush()
+
+    meta = {
+        "west": header["west"] + col0 * cell,
+        "north": header["north"] - row0 * cell,
+        "cell_size": cell,
+        "rows": row1 - row0,
+        "cols": col1 - col0,
+        "source": os.path.basename(sys.argv[1])
+    }
+    with open(os.path.splitext(OUTPUT_PATH)[0] + '.json', 'w') as f:
+        json.dump(meta, f, indent=4)
+    print(f"Wrote {meta['rows']}x{meta['cols']} grid ({float(grid.sum()):,.0f} people) to {OUTPUT_PATH}")
+
+if __name__ == "__main__":
+    main()
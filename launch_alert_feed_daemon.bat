@@ -0,0 +1,5 @@
+@echo off
+cd /d "%~dp0"
+echo Launching shared NWS alert feed daemon...
+python alert_feed_daemon.py
+pause
@@ -1,21 +1,48 @@
 import json
 import time
 import requests
+import requests.adapters
 import random
 import math
 import pyautogui
 import pygetwindow as gw
 import re
 import os
+import bisect
+import heapq
 import signal
 import logging
-from functools import wraps
+import queue
+import threading
+import itertools
+from abc import ABC, abstractmethod
+import sqlite3
+import csv
+import pickle
+import hashlib
+import zlib
+from collections import OrderedDict
+from urllib.parse import urlparse
+from email.utils import parsedate_to_datetime
 from geopy.geocoders import Nominatim
 from datetime import datetime, timezone, timedelta
 from shapely.geometry import shape, Point
+from shapely.strtree import STRtree
+from shapely.ops import unary_union
+from shapely.prepared import prep
 import pytz
 import sys
 
+try:
+    import ijson  # Optional: lets us stream the alerts FeatureCollection instead of loading it whole
+except ImportError:
+    ijson = None
+
+try:
+    import numpy as np  # Optional: polygon-accurate population from population_raster.npy
+except ImportError:
+    np = None
+
 # ========================================================================================
 # --- LOGGING SETUP ---
 # ========================================================================================
@@ -82,7 +109,53 @@ DEFAULT_CONFIG = {
     "CITIES_PER_CYCLE": 5,        # Number of cities to show before switching back to warnings
     "DISPLAY_SEQUENCE": ["current", "forecast", "three_day", "astronomy", "air_quality"],  # Order of displays
     "DISPLAY_DURATION": 15,        # Seconds to show each display type (current, forecast, etc.)
-    "CACHE_DURATION": 900         # Cache weather data for 15 minutes (900 seconds)
+    "CACHE_DURATION": 900,        # Cache weather data for 15 minutes (900 seconds)
+    "NWS_CONDITIONAL_GET": True,  # Send If-None-Match/If-Modified-Since and reuse the last result on 304
+    "NWS_SERVER_SIDE_FILTER": True,  # Push event/status/message_type/area filters into the NWS query
+    "NWS_ALERT_EVENTS": ["Tornado Warning", "Severe Thunderstorm Warning"],  # Warning types we track
+    "NWS_MESSAGE_TYPES": ["alert", "update", "cancel"],  # NWS message types to request
+    "NWS_AREA_FILTER": [],        # Optional list of state codes (e.g. ["OK", "KS"]); empty = whole country
+    "NWS_STREAMING_PARSER": True, # Parse alert features one at a time with ijson when it is installed
+    "BACKGROUND_ALERT_FETCHER": True, # Poll, parse and score NWS alerts on a worker thread
+    "ADAPTIVE_POLLING": True,     # Let activity level and NWS cache headers drive the poll interval
+    "POLL_INTERVAL_MIN_SECONDS": 5,    # Fastest polling (Tornado Warning active)
+    "POLL_INTERVAL_MAX_SECONDS": 60,   # Slowest polling (long quiet stretches)
+    "POLL_ACTIVE_SCORE_THRESHOLD": 50, # Activity score at which polling speeds up
+    "POLL_JITTER_FRACTION": 0.1,  # +/- random fraction applied to every interval
+    "USE_ALERT_FEED": False,      # Read alerts from alert_feed_daemon.py's snapshot instead of calling NWS
+    "ALERT_FEED_PATH": "alert_feed.json",  # Snapshot file written by alert_feed_daemon.py
+    "ALERT_FEED_MAX_AGE_SECONDS": 60,      # Older snapshots mean the daemon is down; call NWS directly
+    "NWS_BREAKER_FAILURE_THRESHOLD": 3,    # Consecutive NWS failures before we stop calling for a while
+    "NWS_BREAKER_BACKOFF_SECONDS": 10,     # First backoff once the breaker opens (doubles each failure)
+    "NWS_BREAKER_MAX_BACKOFF_SECONDS": 300,
+    "NWS_STALE_LIMIT_SECONDS": 900,        # Keep serving the last good warnings for at most this long
+    "RATE_LIMITS": {                       # Per-host token buckets: requests per second and burst size
+        "api.weather.gov": {"rate": 1.0, "burst": 5},
+        "api.weatherapi.com": {"rate": 2.0, "burst": 4},
+        "nominatim.openstreetmap.org": {"rate": 1.0, "burst": 1},  # Nominatim policy: max 1 request/second
+        "default": {"rate": 1.0, "burst": 2}
+    },
+    "RATE_LIMIT_MAX_WAIT_SECONDS": 30,     # Reject a call rather than queue it longer than this
+    "HTTP_POOL_MAXSIZE": 4,                # Keep-alive connections kept per host
+    "HTTP_CONNECT_TIMEOUT_SECONDS": 3.05,  # TCP/TLS connect timeout (read timeouts are set per call)
+    "ALERT_SOURCE": "nws",                 # Where warnings come from: "nws", "directory", "archive" or "synthetic"
+    "ALERT_SOURCE_PATH": "",               # Snapshot directory ("directory") or archive database ("archive")
+    "ALERT_REPLAY_SPEED": 1.0,             # Playback speed for "directory"/"archive" sources (10 = 10x real time)
+    "SYNTHETIC_ALERT_COUNT": 200,          # Warnings kept active by the "synthetic" source
+    "ALERT_ARCHIVE_ENABLED": True,         # Keep every alert and lifecycle change in an append-only SQLite archive
+    "ALERT_ARCHIVE_PATH": "alert_archive.sqlite3",
+    "ALERT_ANALYSIS_CACHE_SIZE": 1000,     # Alerts whose threat/PDS/population analysis is memoized
+    "POPULATION_INDEX_PATH": "population_index.csv",  # SAME/UGC code -> population table (build_population_index.py)
+    "POPULATION_RASTER_PATH": "population_raster.npy",  # Gridded population counts (build_population_raster.py); needs numpy
+    "POPULATION_PLACES_PATH": "population_places.pkl",  # Block-group/place population points (build_population_places.py)
+    "POPULATION_CACHE_PATH": "population_cache.sqlite3",  # Population results kept across restarts, keyed by polygon
+    "POPULATION_CACHE_TTL_SECONDS": 2592000,   # Recompute cached populations after 30 days
+    "POPULATION_CACHE_MAX_ENTRIES": 50000,     # Least recently used polygons are dropped beyond this
+    "REGION_OF_INTEREST": {                # Only alerts touching this region reach the monitor; all empty = whole country
+        "states": [],                      # State codes matched against the alert's UGC zones/counties (e.g. ["OK", "KS"])
+        "cwas": [],                        # NWS offices that issued the alert (e.g. ["OUN", "TSA"])
+        "geojson": ""                      # GeoJSON file (Polygon/Feature/FeatureCollection) the warning polygon must intersect
+    }
 }
 
 def load_config():
@@ -114,26 +187,141 @@ CONFIG = load_config()
 # ========================================================================================
 # --- RATE LIMITING ---
 # ========================================================================================
-def rate_limit(min_interval=1.0):
-    """Decorator to enforce minimum time between API calls"""
-    last_called = {}
-    
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            key = func.__name__
-            current_time = time.time()
-            if key in last_called:
-                elapsed = current_time - last_called[key]
-                if elapsed < min_interval:
-                    sleep_time = min_interval - elapsed
-                    logger.debug(f"Rate limiting {key}: sleeping {sleep_time:.2f}s")
-                    time.sleep(sleep_time)
-            result = func(*args, **kwargs)
-            last_called[key] = time.time()
-            return result
-        return wrapper
-    return decorator
+class RateLimitExceeded(Exception):
+    """Raised when a call would have to wait longer than RATE_LIMIT_MAX_WAIT_SECONDS for a token"""
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens per second up to `burst`.
+    
+    Callers reserve a token under the lock and then sleep only for their own place in the
+    queue, so concurrent threads are served in arrival order without busy-waiting.
+    """
+    
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.stats = {"calls": 0, "waited_calls": 0, "wait_seconds": 0.0, "rejected": 0}
+    
+    def acquire(self, max_wait):
+        """Take one token, sleeping as long as needed; returns False if that would exceed max_wait"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            if wait > max_wait:
+                self.stats["rejected"] += 1
+                return False
+            
+            self.tokens -= 1  # May go negative: later callers queue behind this reservation
+            self.stats["calls"] += 1
+            if wait > 0:
+                self.stats["waited_calls"] += 1
+                self.stats["wait_seconds"] += wait
+        
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+rate_limit_buckets = {}
+rate_limit_buckets_lock = threading.Lock()
+
+def get_rate_limit_bucket(host):
+    """Return the shared token bucket for a host, creating it from RATE_LIMITS on first use"""
+    with rate_limit_buckets_lock:
+        if host not in rate_limit_buckets:
+            limits = CONFIG["RATE_LIMITS"].get(host) or CONFIG["RATE_LIMITS"].get("default") or DEFAULT_CONFIG["RATE_LIMITS"]["default"]
+            rate_limit_buckets[host] = TokenBucket(limits["rate"], limits["burst"])
+        return rate_limit_buckets[host]
+
+def rate_limit(url):
+    """Wait for a request slot for the URL's host, raising RateLimitExceeded if the queue is too long"""
+    host = urlparse(url).hostname or url
+    if not get_rate_limit_bucket(host).acquire(CONFIG["RATE_LIMIT_MAX_WAIT_SECONDS"]):
+        raise RateLimitExceeded(f"Rate limit queue for {host} is longer than {CONFIG['RATE_LIMIT_MAX_WAIT_SECONDS']}s")
+
+def get_rate_limit_stats():
+    """Per-host limiter counters (calls, waits, total wait time, rejections)"""
+    with rate_limit_buckets_lock:
+        return {host: {k: round(v, 2) if isinstance(v, float) else v for k, v in bucket.stats.items()}
+                for host, bucket in rate_limit_buckets.items()}
+
+# ========================================================================================
+# --- HTTP CLIENTS ---
+# ========================================================================================
+try:
+    import brotli  # Optional: only advertise br when urllib3 can actually decode it
+    HTTP_ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    HTTP_ACCEPT_ENCODING = "gzip"
+
+http_sessions = {}
+http_stats = {}
+http_sessions_lock = threading.Lock()
+
+def get_http_session(host):
+    """Return the pooled keep-alive session for a host, creating it on first use"""
+    with http_sessions_lock:
+        if host not in http_sessions:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=CONFIG["HTTP_POOL_MAXSIZE"],
+                max_retries=0  # Failures are handled by the callers (and the NWS circuit breaker)
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Accept-Encoding"] = HTTP_ACCEPT_ENCODING
+            http_sessions[host] = session
+            http_stats[host] = {"requests": 0, "errors": 0, "total_latency": 0.0, "max_latency": 0.0}
+        return http_sessions[host]
+
+def count_http_connections(session):
+    """Number of TCP/TLS connections the session's pools have opened so far"""
+    total = 0
+    for adapter in set(session.adapters.values()):  # The same adapter is mounted for http:// and https://
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            total += getattr(pools[key], 'num_connections', 0)
+    return total
+
+def http_get(url, timeout=15, **kwargs):
+    """Rate-limited GET through the host's pooled session, recording latency per host"""
+    host = urlparse(url).hostname or url
+    rate_limit(url)
+    session = get_http_session(host)
+    stats = http_stats[host]
+    
+    start = time.monotonic()
+    try:
+        response = session.get(url, timeout=(CONFIG["HTTP_CONNECT_TIMEOUT_SECONDS"], timeout), **kwargs)
+    except Exception:
+        stats["errors"] += 1
+        raise
+    finally:
+        latency = time.monotonic() - start
+        stats["requests"] += 1
+        stats["total_latency"] += latency
+        stats["max_latency"] = max(stats["max_latency"], latency)
+    return response
+
+def get_http_stats():
+    """Per-host request counts, latency and connection setups"""
+    with http_sessions_lock:
+        result = {}
+        for host, stats in http_stats.items():
+            result[host] = {
+                "requests": stats["requests"],
+                "errors": stats["errors"],
+                "avg_latency": round(stats["total_latency"] / stats["requests"], 3) if stats["requests"] else None,
+                "max_latency": round(stats["max_latency"], 3),
+                "connections_opened": count_http_connections(http_sessions[host])
+            }
+        return result
 
 # ========================================================================================
 # --- STATE MANAGEMENT ---
@@ -142,7 +330,7 @@ def save_state():
     """Save current state to allow resuming after restart"""
     try:
         state_data = {
-            "active_warnings": [w.get('id', '') for w in active_warnings_cache],
+            "active_warnings": [w.id for w in active_warnings_cache],
             "warning_display_index": warning_display_index,
             "cities_shown_in_break": cities_shown_in_break,
             "last_action_timestamp": last_action_timestamp,
@@ -151,7 +339,11 @@ def save_state():
             "current_display": current_display,
             "display_start_time": display_start_time,
             "current_city": current_city,  # Save current city to resume display cycle
-            "city_start_time": city_start_time  # Save city overall timer
+            "city_start_time": city_start_time,  # Save city overall timer
+            "nws_status": get_nws_breaker_status(),  # Reported only, not restored on startup
+            "rate_limits": get_rate_limit_stats(),   # Reported only, not restored on startup
+            "http": get_http_stats(),                # Reported only, not restored on startup
+            "analysis_cache": alert_analysis_cache.stats()  # Reported only, not restored on startup
         }
         
         # Use a temporary file for atomic write
@@ -444,6 +636,19 @@ NWS_API_HEADERS = {
     "Accept": "application/geo+json"
 }
 
+# Epoch time until which the last NWS response is fresh per Cache-Control/Expires
+nws_fresh_until = 0
+quiet_poll_streak = 0
+
+# Validators and parsed result of the last successful NWS poll (for conditional GETs)
+nws_poll_cache = {
+    "feed_sequence": None,
+    "params": None,
+    "etag": None,
+    "last_modified": None,
+    "warnings": []
+}
+
 # --- Radar Sites (abbreviated) ---
 RADAR_SITES = [
     {"id": "KABR", "lat": 45.45, "lon": -98.41, "desc": "Aberdeen, SD"},
@@ -722,62 +927,56 @@ def navigate_by_name(search_term: str, zoom_out_steps: int):
 # ========================================================================================
 # --- DATA WRITING FUNCTIONS ---
 # ========================================================================================
-def write_infobox_data(warning_feature):
+# Alert currently shown in warning_data.json, so a late population result can patch the box
+infobox_lock = threading.RLock()
+infobox_alert = None
+
+def write_infobox_data(alert):
     """Write warning data to JSON file for display"""
-    try:
-        props = warning_feature.get('properties') if warning_feature else None
-        if not props:
-            data_to_write = {"visible": False}
-        else:
-            params = props.get('parameters') or {}
-            threats = extract_threats_from_description(props.get('description', ''))
-            
-            # Get population using new function
-            population = get_warning_population(warning_feature)
-            
-            # Check for PDS status
-            is_pds = False
-            headline = props.get('headline', '').upper()
-            description = props.get('description', '').upper()
-            
-            if "PARTICULARLY DANGEROUS SITUATION" in headline or "PARTICULARLY DANGEROUS SITUATION" in description:
-                is_pds = True
-            
-            # Get wind information - try parameters first, then threats
-            wind_info = "N/A"
-            if params.get('windGust', [None])[0]:
-                wind_info = f"{params.get('windGust', [None])[0]} MPH"
-            elif threats.get('wind'):
-                wind_info = threats.get('wind')
-            
-            # Get hail information - try parameters first, then threats
-            hail_info = "N/A"
-            if params.get("hailSize", [None])[0]:
-                hail_info = f'{params.get("hailSize", [None])[0]}"'
-            elif threats.get('hail'):
-                hail_info = threats.get('hail')
-            
-            data_to_write = {
-                "visible": True,
-                "type": "TORNADO WARNING" if props.get('event') == "Tornado Warning" else "SEVERE T-STORM WARNING",
-                "area": props.get('areaDesc', 'N/A'),
-                "population": f"{population:,}" if population > 0 else "N/A",
-                "severity": props.get('severity', 'N/A'),
-                "certainty": props.get('certainty', 'N/A'),
-                "wind": wind_info,
-                "hail": hail_info,
-                "expires": get_formatted_expiration(props.get('expires'), CONFIG["LOCAL_TIMEZONE"]),
-                "isPDS": is_pds
-            }
-        
-        with open('warning_data.json', 'w', encoding='utf-8') as f:
-            json.dump(data_to_write, f, indent=4)
+    global infobox_alert
+    with infobox_lock:
+        infobox_alert = alert
+        try:
+            if not alert:
+                data_to_write = {"visible": False}
+            else:
+                threats = alert.threats
+                
+                # Population arrives from the enrichment worker; show a placeholder until it does
+                population = get_infobox_population(alert)
+                if population is None:
+                    population_text = "Calculating..."
+                else:
+                    population_text = f"{population:,}" if population > 0 else "N/A"
+                
+                data_to_write = {
+                    "visible": True,
+                    "type": "TORNADO WARNING" if alert.event == "Tornado Warning" else "SEVERE T-STORM WARNING",
+                    "area": alert.area_desc,
+                    "population": population_text,
+                    "severity": alert.severity,
+                    "certainty": alert.certainty,
+                    "wind": threats.wind_text or "N/A",
+                    "hail": threats.hail_text or "N/A",
+                    "windThreat": threats.wind_threat,
+                    "hailThreat": threats.hail_threat,
+                    "tornadoDetection": threats.tornado_detection,
+                    "damageThreat": threats.damage_threat,
+                    "expires": get_formatted_expiration(alert.expires_str, CONFIG["LOCAL_TIMEZONE"]),
+                    "isPDS": alert.is_pds
+                }
             
-    except Exception as e:
-        logger.error(f"ERROR writing warning data: {e}", exc_info=True)
+            with open('warning_data.json', 'w', encoding='utf-8') as f:
+                json.dump(data_to_write, f, indent=4)
+                
+        except Exception as e:
+            logger.error(f"ERROR writing warning data: {e}", exc_info=True)
 
 def hide_all_weather_displays():
     """Hide all weather display boxes"""
+    global infobox_alert
+    with infobox_lock:
+        infobox_alert = None  # Nothing left for a population result to patch
     for filename in ['current_conditions.json', 'daily_forecast.json', 'three_day_forecast.json', 'astronomy.json', 'air_quality.json', 'warning_data.json']:
         try:
             with open(filename, 'w') as f:
@@ -788,7 +987,6 @@ def hide_all_weather_displays():
 # ========================================================================================
 # --- WEATHERAPI FUNCTIONS ---
 # ========================================================================================
-@rate_limit(min_interval=1.0)
 def get_weatherapi_data(city_name):
     """Fetch weather data from WeatherAPI.com"""
     global weather_cache
@@ -810,10 +1008,10 @@ def get_weatherapi_data(city_name):
             'days': 3  # Get 3 days of forecast data
         }
         
-        response = requests.get('https://api.weatherapi.com/v1/forecast.json', params=params, timeout=15)
+        response = http_get('https://api.weatherapi.com/v1/forecast.json', params=params, timeout=15)
         response.raise_for_status()
         
-        astro_response = requests.get('https://api.weatherapi.com/v1/astronomy.json', params=params, timeout=15)
+        astro_response = http_get('https://api.weatherapi.com/v1/astronomy.json', params=params, timeout=15)
         astro_response.raise_for_status()
         
         combined_data = {
@@ -1048,9 +1246,8 @@ def calculate_weather_activity_score(warnings):
     
     # Process each warning
     for warning in warnings:
-        props = warning.get('properties', {})
-        event_type = props.get('event', 'Unknown')
-        severity = props.get('severity', 'Unknown')
+        event_type = warning.event
+        severity = warning.severity
         
         # Count by type
         if event_type not in type_counts:
@@ -1079,11 +1276,7 @@ def calculate_weather_activity_score(warnings):
             base_score *= 0.5
         
         # Check for PDS
-        is_pds = False
-        headline = props.get('headline', '').upper()
-        description = props.get('description', '').upper()
-        if "PARTICULARLY DANGEROUS SITUATION" in headline or "PARTICULARLY DANGEROUS SITUATION" in description:
-            is_pds = True
+        if warning.is_pds:
             base_score *= 1.5  # 50% increase for PDS warnings
             
             # Count PDS tornado warnings separately
@@ -1140,41 +1333,346 @@ def write_weather_activity_score(warnings):
 # ========================================================================================
 # --- DATA FETCHING AND PARSING FUNCTIONS FOR NWS WARNINGS ---
 # ========================================================================================
-def is_warning_expired(warning_feature):
-    """Check if a warning has expired"""
+PDS_PHRASE = "PARTICULARLY DANGEROUS SITUATION"
+
+# P-VTEC: /k.aaa.cccc.pp.s.####.yymmddThhnnZ-yymmddThhnnZ/ (class.action.office.phenomenon.significance.ETN)
+VTEC_PATTERN = re.compile(r'/O\.([A-Z]{3})\.([A-Z]{4})\.([A-Z]{2})\.([A-Z])\.(\d{4})\.')
+VTEC_TERMINAL_ACTIONS = {"CAN", "EXP", "UPG"}  # Actions that end the event
+
+def parse_vtec(parameters):
+    """Return ((office, phenomenon, significance, ETN), action) from an alert's VTEC, or (None, None)"""
+    for vtec in parameters.get('VTEC') or []:
+        if match := VTEC_PATTERN.search(vtec):
+            action, office, phenomenon, significance, etn = match.groups()
+            return (office, phenomenon, significance, etn), action
+    return None, None
+
+def parse_nws_timestamp(timestamp_str):
+    """Parse an NWS ISO 8601 timestamp into epoch seconds (0 if missing or invalid)"""
     try:
-        return datetime.fromisoformat(warning_feature['properties']['expires']) <= datetime.now(pytz.utc)
-    except:
-        return True
+        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00')).timestamp()
+    except Exception:
+        return 0.0
+
+class AlertAnalysisCache:
+    """LRU memo of per-alert analysis (threats, PDS, population) keyed by alert ID and description hash.
+    
+    NWS re-sends every active alert on every poll and the rotation shows the same warnings over and
+    over, so each alert is analyzed once; entries are dropped when the alert leaves the store.
+    """
+    
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()  # alert_id -> (description_hash, {kind: value})
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, alert_id, description, kind, compute):
+        """Return the memoized `kind` result for this alert, calling compute() on a miss"""
+        digest = hash(description)
+        with self.lock:
+            entry = self.entries.get(alert_id)
+            if entry is not None and entry[0] == digest and kind in entry[1]:
+                self.entries.move_to_end(alert_id)
+                self.hits += 1
+                return entry[1][kind]
+            self.misses += 1
+        
+        # Compute outside the lock - population lookups can go to the network
+        value = compute()
+        
+        with self.lock:
+            entry = self.entries.get(alert_id)
+            if entry is None or entry[0] != digest:
+                entry = (digest, {})
+                self.entries[alert_id] = entry
+            entry[1][kind] = value
+            self.entries.move_to_end(alert_id)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return value
+    
+    def peek(self, alert_id, description, kind):
+        """Return a memoized result without computing it (None on a miss)"""
+        digest = hash(description)
+        with self.lock:
+            entry = self.entries.get(alert_id)
+            if entry is not None and entry[0] == digest:
+                return entry[1].get(kind)
+        return None
+    
+    def evict(self, alert_id):
+        with self.lock:
+            self.entries.pop(alert_id, None)
+    
+    def on_store_change(self, event, alert):
+        """alert_store subscriber: forget alerts that are no longer active"""
+        if event in ("superseded", "cancelled", "expired"):
+            self.evict(alert.id)
+    
+    def stats(self):
+        with self.lock:
+            return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+alert_analysis_cache = AlertAnalysisCache(CONFIG["ALERT_ANALYSIS_CACHE_SIZE"])
+
+class Alert:
+    """Compact record for one NWS alert, built once at ingest with precomputed sort keys"""
+    __slots__ = (
+        "id", "event", "status", "message_type", "severity", "certainty",
+        "headline", "description", "area_desc", "parameters", "geocode", "references", "geometry",
+        "sent", "expires", "sent_str", "expires_str", "is_pds", "priority", "sort_key",
+        "vtec_key", "vtec_action", "issued", "threats"
+    )
+    
+    def __init__(self, feature):
+        props = feature.get('properties') or {}
+        params = props.get('parameters') or {}
+        
+        self.id = feature.get('id') or props.get('id', '')
+        self.event = props.get('event') or 'Unknown'
+        self.status = props.get('status') or ''
+        self.message_type = props.get('messageType') or 'Alert'
+        self.severity = props.get('severity') or 'Unknown'
+        self.certainty = props.get('certainty') or 'N/A'
+        self.headline = props.get('headline') or ''
+        self.description = props.get('description') or ''
+        self.area_desc = props.get('areaDesc') or 'N/A'
+        self.parameters = params
+        self.geocode = props.get('geocode') or {}
+        self.references = tuple(ref.get('identifier') for ref in props.get('references') or [])
+        self.geometry = feature.get('geometry')
+        
+        self.sent_str = props.get('sent') or ''
+        self.expires_str = props.get('expires') or ''
+        self.sent = parse_nws_timestamp(self.sent_str)
+        self.expires = parse_nws_timestamp(self.expires_str)
+        
+        self.is_pds = alert_analysis_cache.get(self.id, self.description, "is_pds",
+                                               lambda: PDS_PHRASE in self.headline.upper() or PDS_PHRASE in self.description.upper())
+        self.priority = get_warning_priority(self)
+        self.sort_key = (self.priority, self.sent, self.id)
+        
+        # Storm-based warnings keep one VTEC event across NEW/CON/EXT/CAN/EXP messages
+        self.vtec_key, self.vtec_action = parse_vtec(params)
+        self.issued = self.sent  # Time the underlying event was first issued (kept across updates)
+        
+        self.threats = alert_analysis_cache.get(self.id, self.description, "threats",
+                                                lambda: build_threat_info(params, self.description))
+    
+    def __repr__(self):
+        return f"Alert({self.id!r}, {self.event!r}{', PDS' if self.is_pds else ''})"
+    
+    def to_feature(self):
+        """Rebuild the GeoJSON feature this alert was parsed from (the fields Alert keeps)"""
+        return {
+            "id": self.id,
+            "geometry": self.geometry,
+            "properties": {
+                "id": self.id,
+                "event": self.event,
+                "status": self.status,
+                "messageType": self.message_type,
+                "severity": self.severity,
+                "certainty": self.certainty,
+                "headline": self.headline,
+                "description": self.description,
+                "areaDesc": self.area_desc,
+                "parameters": self.parameters,
+                "geocode": self.geocode,
+                "references": [{"identifier": ref} for ref in self.references],
+                "sent": self.sent_str,
+                "expires": self.expires_str
+            }
+        }
+
+def is_warning_expired(alert, now=None):
+    """Check if a warning has expired"""
+    return alert.expires <= (now if now is not None else time.time())
 
 def cleanup_old_warnings():
-    """Remove expired warnings from cache"""
-    global active_warnings_cache
-    active_warnings_cache = [w for w in active_warnings_cache if not is_warning_expired(w)]
-
-def merge_new_warnings(current_warnings, existing_warnings):
-    """Merge new warnings with existing ones, maintaining proper priority order"""
-    existing_ids = {w.get('id') for w in existing_warnings}
-    new = [w for w in current_warnings if w.get('id') not in existing_ids]
-    still_active = [w for w in existing_warnings if w.get('id') in {cw.get('id') for cw in current_warnings}]
-    combined = new + still_active
-    
-    # Sort using the same priority function as get_and_sort_active_warnings
-    def get_priority(warning):
-        props = warning.get('properties', {})
-        event_type = props.get('event', '')
-        is_pds = is_pds_warning(warning)
+    """Remove expired warnings from the alert store"""
+    return alert_store.remove_expired()
+
+def get_warning_priority(alert):
+    """Priority for rotation order: PDS Tornado (0), Tornado (1), PDS Severe T-storm (2), Severe T-storm (3)"""
+    if alert.event == "Tornado Warning":
+        return 0 if alert.is_pds else 1
+    elif alert.event == "Severe Thunderstorm Warning":
+        return 2 if alert.is_pds else 3
+    else:
+        return 4  # Fallback for any other warning types
+
+class AlertStore:
+    """Active warnings keyed by alert ID, kept in rotation order and updated with per-poll deltas.
+    
+    Alerts carrying a VTEC event key are collapsed to one entry per storm: a CON/EXT message
+    replaces the previous message for that event in place, and CAN/EXP/UPG removes it.
+    
+    Change events are passed to subscribers as (event, alert) where event is one of
+    "new", "updated", "superseded", "cancelled" or "expired".
+    """
+    
+    def __init__(self):
+        self.alerts = {}        # alert ID -> Alert
+        self._keys = []         # sorted rotation keys (priority, sent, id)
+        self._order = []        # Alert records, parallel to _keys
+        self._retired = set()   # IDs superseded or cancelled but possibly still in the feed
+        self._events = {}       # VTEC event key -> ID of the alert currently representing it
+        self._expiry_heap = []  # (expires epoch, alert ID) min-heap; entries for removed alerts are skipped lazily
+        self._subscribers = []
+    
+    def subscribe(self, callback):
+        """Register a callback(event, alert) for store changes"""
+        self._subscribers.append(callback)
+    
+    def _emit(self, event, alert):
+        for callback in self._subscribers:
+            try:
+                callback(event, alert)
+            except Exception as e:
+                logger.error(f"AlertStore subscriber failed on '{event}': {e}")
+    
+    def _insert(self, alert):
+        index = bisect.bisect_left(self._keys, alert.sort_key)
+        self._keys.insert(index, alert.sort_key)
+        self._order.insert(index, alert)
+        self.alerts[alert.id] = alert
+        if alert.vtec_key:
+            self._events[alert.vtec_key] = alert.id
+        heapq.heappush(self._expiry_heap, (alert.expires, alert.id))
+    
+    def _remove(self, alert_id):
+        alert = self.alerts.pop(alert_id, None)
+        if alert is None:
+            return None
+        index = bisect.bisect_left(self._keys, alert.sort_key)
+        del self._keys[index]
+        del self._order[index]
+        if alert.vtec_key and self._events.get(alert.vtec_key) == alert.id:
+            del self._events[alert.vtec_key]
+        return alert
+    
+    def _apply_vtec(self, warning, live_keys, changes):
+        """Merge a VTEC-coded message into the single store entry for its event"""
+        current_id = self._events.get(warning.vtec_key)
+        current = self.alerts.get(current_id) if current_id else None
+        
+        # An older (or same-time sibling) message for an event we already track,
+        # e.g. the NEW still listed in the feed next to its CON
+        if current is not None and warning.sent <= current.sent:
+            self._retired.add(warning.id)
+            return
         
-        if event_type == "Tornado Warning":
-            return 0 if is_pds else 1
-        elif event_type == "Severe Thunderstorm Warning":
-            return 2 if is_pds else 3
-        else:
-            return 4
-    
-    combined.sort(key=lambda w: (get_priority(w), w['properties']['sent']))
-    
-    return combined
+        if warning.vtec_action in VTEC_TERMINAL_ACTIONS:
+            self._retired.add(warning.id)
+            # A partial cancellation comes with a CON segment for the rest of the area - that one wins
+            if current is not None and warning.vtec_key not in live_keys:
+                self._remove(current.id)
+                changes.append(("expired" if warning.vtec_action == "EXP" else "cancelled", current))
+            return
+        
+        if current is None:
+            self._insert(warning)
+            changes.append(("new", warning))
+            return
+        
+        # Same storm: keep its original issue time and rotation slot
+        self._remove(current.id)
+        warning.issued = current.issued
+        warning.sort_key = (warning.priority, current.sort_key[1], current.sort_key[2])
+        self._insert(warning)
+        changes.append(("superseded", current))
+        changes.append(("updated", warning))
+    
+    def apply(self, current_warnings):
+        """Apply one poll's worth of warnings, returning the list of (event, alert) changes"""
+        changes = []
+        current_ids = {w.id for w in current_warnings}
+        
+        # Only messages we have not seen yet cost anything - NWS messages are immutable per ID.
+        # A reused (304) result can still hold alerts the expiry heap already removed, so skip those.
+        now = time.time()
+        incoming = [w for w in current_warnings
+                    if w.id and w.id not in self.alerts and w.id not in self._retired
+                    and not is_warning_expired(w, now)]
+        
+        # Updates and cancels replace the messages they reference, which may still linger in the feed
+        for warning in incoming:
+            self._retired.update(warning.references)
+        
+        # Oldest first so the latest message for a storm ends up representing it
+        incoming.sort(key=lambda w: w.sent)
+        live_keys = {w.vtec_key for w in incoming if w.vtec_key and w.vtec_action not in VTEC_TERMINAL_ACTIONS}
+        
+        for warning in incoming:
+            if warning.id in self._retired:
+                continue
+            
+            if warning.vtec_key:
+                self._apply_vtec(warning, live_keys, changes)
+                continue
+            
+            for ref_id in warning.references:
+                if (old := self._remove(ref_id)) is not None:
+                    changes.append(("cancelled" if warning.message_type == "Cancel" else "superseded", old))
+            
+            if warning.message_type == "Cancel":
+                self._retired.add(warning.id)
+                continue
+            
+            self._insert(warning)
+            changes.append(("updated" if warning.message_type == "Update" and warning.references else "new", warning))
+        
+        # Forget retired IDs once they have left the feed
+        self._retired &= current_ids
+        
+        # Anything no longer in the feed has expired or been withdrawn
+        for alert_id in self.alerts.keys() - current_ids:
+            changes.append(("expired", self._remove(alert_id)))
+        
+        for event, alert in changes:
+            logger.debug(f"AlertStore: {event} {alert.id}")
+            self._emit(event, alert)
+        
+        return changes
+    
+    def _prune_expiry_heap(self):
+        """Drop heap entries whose alert has already left the store"""
+        heap = self._expiry_heap
+        while heap and (heap[0][1] not in self.alerts or self.alerts[heap[0][1]].expires != heap[0][0]):
+            heapq.heappop(heap)
+    
+    def remove_expired(self, now=None):
+        """Pop warnings off the expiry heap whose expiration time has passed"""
+        now = now if now is not None else time.time()
+        expired = []
+        self._prune_expiry_heap()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, alert_id = heapq.heappop(self._expiry_heap)
+            expired.append(self._remove(alert_id))
+            self._prune_expiry_heap()
+        
+        for warning in expired:
+            logger.debug(f"AlertStore: expired {warning.id}")
+            self._emit("expired", warning)
+        return expired
+    
+    def next_expiry(self):
+        """Epoch time the next warning expires, or None if the store is empty"""
+        self._prune_expiry_heap()
+        return self._expiry_heap[0][0] if self._expiry_heap else None
+    
+    def ordered(self):
+        """Return the active warnings in rotation order"""
+        return list(self._order)
+    
+    def __len__(self):
+        return len(self._order)
+
+alert_store = AlertStore()
+alert_store.subscribe(alert_analysis_cache.on_store_change)
 
 def get_formatted_expiration(expires_str, local_tz_str):
     """Format expiration time for display"""
@@ -1199,6 +1697,78 @@ def get_formatted_expiration(expires_str, local_tz_str):
         logger.error(f"WARNING: Could not format expiration time: {expires_str} - Error: {e}")
         return "N/A"  # Return N/A only if parsing fails
 
+# Structured tags at the bottom of warning text, e.g. "MAX HAIL SIZE...1.00 IN" or "* HAZARD...60 mph wind gusts"
+THREAT_TAG_PATTERN = re.compile(r'^[ \t*]*(MAX WIND GUST|MAX HAIL SIZE|WIND|HAIL|HAZARD|TORNADO)\.\.\.[ \t]*([^\n]*)', re.MULTILINE)
+TAG_WIND_PATTERN = re.compile(r'<?(\d+)\s*MPH')
+TAG_HAIL_PATTERN = re.compile(r'<?(\d*\.?\d+)\s*IN')
+
+# Free-text fallbacks; every gap is bounded so a long description can't trigger backtracking
+# Free-text wind speeds must sit next to WIND/GUST in the same clause; a bare "NN MPH" is
+# almost always storm motion ("MOVING EAST AT 45 MPH")
+TEXT_WIND_PATTERNS = (
+    re.compile(r'(\d+)\s*MPH\s*(?:WIND|GUST)'),                  # "70 MPH WIND GUSTS"
+    re.compile(r'(?:WIND|GUST)([^0-9.;\n]{0,40}?)(\d+)\s*MPH')     # "WINDS TO 60 MPH"
+)
+TEXT_HAIL_PATTERN = re.compile(r'(\d+/\d+|\d*\.?\d+)\s*(?:INCH|")')
+NEARBY_HAIL_PATTERN = re.compile(r'HAIL[^0-9\n]{0,40}(\d*\.?\d+)')
+SMALL_HAIL_PATTERN = re.compile(r'SMALL\s+HAIL|PEA\s+SIZE')
+
+# Descriptive hail sizes, most specific first when several appear
+HAIL_SIZE_NAMES = {
+    "BASEBALL": '2.75"',
+    "TENNIS BALL": '2.50"',
+    "GOLF BALL": '1.75"',
+    "PING PONG BALL": '1.50"',
+    "WALNUT": '1.50"',
+    "HALF DOLLAR": '1.25"',
+    "QUARTER": '1.00"',
+    "NICKEL": '0.88"',
+    "PENNY": '0.75"',
+    "DIME": '0.70"',
+    "MARBLE": '0.63"',
+    "MOTHBALL": '0.50"'
+}
+HAIL_SIZE_NAME_PATTERN = re.compile('|'.join(re.escape(name) for name in HAIL_SIZE_NAMES))
+
+def parse_threat_tags(description_upper):
+    """Collect the structured NWS threat tags from upper-cased warning text in one pass (first value per tag)"""
+    tags = {}
+    for match in THREAT_TAG_PATTERN.finditer(description_upper):
+        tags.setdefault(match.group(1), match.group(2).strip())
+    return tags
+
+def format_hail_size(hail_size):
+    """Format a captured hail size (decimal or fraction) as inches"""
+    if '/' in hail_size:
+        numerator, denominator = hail_size.split('/')
+        if int(denominator):
+            return f'{round(int(numerator) / int(denominator), 2)}"'
+    return f'{hail_size}"'
+
+def find_wind_in_text(text):
+    """First wind speed in free text, if the text is about wind"""
+    if 'WIND' in text or 'GUST' in text:
+        for pattern in TEXT_WIND_PATTERNS:
+            for match in pattern.finditer(text):
+                if 'MOVING' in match.group(0):  # "WINDS ... MOVING EAST AT 45 MPH" is storm motion
+                    continue
+                return f"{match.group(match.lastindex)} MPH"
+    return None
+
+def find_hail_in_text(text):
+    """Hail size from free text: measured sizes, then small hail, then descriptive sizes"""
+    if 'HAIL' not in text:
+        return None
+    if match := TEXT_HAIL_PATTERN.search(text):
+        return format_hail_size(match.group(1))
+    if SMALL_HAIL_PATTERN.search(text):
+        return '0.25"'
+    names = set(HAIL_SIZE_NAME_PATTERN.findall(text))
+    for size_name, size_value in HAIL_SIZE_NAMES.items():
+        if size_name in names:
+            return size_value
+    return None
+
 def extract_threats_from_description(description_text):
     """Extract wind and hail threat information from warning description"""
     threats = {'wind': None, 'hail': None}
@@ -1206,114 +1776,261 @@ def extract_threats_from_description(description_text):
         return threats
 
     description_upper = description_text.upper()
+    tags = parse_threat_tags(description_upper)
 
-    # Look for wind information in multiple patterns
-    wind_patterns = [
-        r'MAX WIND GUST\.\.\.(\d+)\s*MPH',  # NWS structured format (check first)
-        r'(\d+)\s*MPH\s*WIND',
-        r'WIND.*?(\d+)\s*MPH',
-        r'(\d+)\s*MPH.*?WIND',
-        r'WINDS.*?(\d+)\s*MPH',
-        r'(\d+)\s*MPH.*?GUST',
-        r'GUST.*?(\d+)\s*MPH'
-    ]
-
-    for pattern in wind_patterns:
-        if match := re.search(pattern, description_upper):
+    # Structured tags are authoritative
+    for tag in ('MAX WIND GUST', 'WIND'):
+        if tag in tags and (match := TAG_WIND_PATTERN.match(tags[tag])):
             threats['wind'] = f"{match.group(1)} MPH"
             break
+    for tag in ('MAX HAIL SIZE', 'HAIL'):
+        if tag in tags and (match := TAG_HAIL_PATTERN.match(tags[tag])):
+            threats['hail'] = format_hail_size(match.group(1))
+            break
 
-    # Look for hail information - FIXED for NWS structured format
-    hail_patterns = [
-        # NWS structured format with < symbol - FIXED: using literal dots
-        r'MAX HAIL SIZE\.\.\.<(\d*\.?\d+)\s*IN',
-        r'HAIL SIZE\.\.\.<(\d*\.?\d+)\s*IN',
-        # NWS structured format without < symbol
-        r'MAX HAIL SIZE\.\.\.(\d*\.?\d+)\s*IN',
-        r'HAIL SIZE\.\.\.(\d*\.?\d+)\s*IN',
-        # Decimal sizes (like 0.75, 0.88, etc.)
-        r'(\d*\.?\d+)\s*INCH.*?HAIL',
-        r'HAIL.*?(\d*\.?\d+)\s*INCH',
-        r'(\d*\.?\d+)".*?HAIL',
-        r'HAIL.*?(\d*\.?\d+)"',
-        # Fractional sizes (like 3/4, 7/8, etc.)
-        r'(\d+/\d+)\s*INCH.*?HAIL',
-        r'HAIL.*?(\d+/\d+)\s*INCH',
-        r'(\d+/\d+)".*?HAIL',
-        r'HAIL.*?(\d+/\d+)"',
-        # Small hail descriptors
-        r'SMALL\s+HAIL',
-        r'PEA\s+SIZE.*?HAIL',
-        r'HAIL.*?PEA\s+SIZE'
-    ]
+    # Then the HAZARD line, then the full text
+    hazard = tags.get('HAZARD', '')
+    if not threats['wind']:
+        threats['wind'] = find_wind_in_text(hazard) or find_wind_in_text(description_upper)
+    if not threats['hail']:
+        threats['hail'] = find_hail_in_text(hazard) or find_hail_in_text(description_upper)
 
-    for pattern in hail_patterns:
-        if match := re.search(pattern, description_upper):
-            hail_size = match.group(1) if match.groups() else None
-            if hail_size:
-                # Convert fractions to decimal
-                if '/' in hail_size:
-                    try:
-                        parts = hail_size.split('/')
-                        decimal_size = round(int(parts[0]) / int(parts[1]), 2)
-                        threats['hail'] = f'{decimal_size}"'
-                    except:
-                        threats['hail'] = f'{hail_size}"'
-                else:
-                    threats['hail'] = f'{hail_size}"'
-                break
-            else:
-                # Handle descriptive terms
-                if 'SMALL' in pattern or 'PEA' in pattern:
-                    threats['hail'] = '0.25"'
-                    break
+    # Hail mentioned without a recognizable size: take a number right after the word, else assume small hail
+    if not threats['hail'] and 'HAIL' in description_upper:
+        nearby = NEARBY_HAIL_PATTERN.search(description_upper)
+        if nearby and float(nearby.group(1)) < 10:  # Reasonable hail size
+            threats['hail'] = f'{nearby.group(1)}"'
+        else:
+            threats['hail'] = '0.50"'
 
-    # If no numeric hail size found, look for descriptive sizes (including small ones)
-    if not threats['hail']:
-        hail_sizes = {
-            "BASEBALL": '2.75"',
-            "TENNIS BALL": '2.50"',
-            "GOLF BALL": '1.75"',
-            "PING PONG BALL": '1.50"',
-            "WALNUT": '1.50"',
-            "HALF DOLLAR": '1.25"',
-            "QUARTER": '1.00"',
-            "NICKEL": '0.88"',
-            "PENNY": '0.75"',
-            "DIME": '0.70"',
-            "PEA SIZE": '0.25"',
-            "PEA SIZED": '0.25"',
-            "SMALL HAIL": '0.50"',
-            "MARBLE": '0.63"',
-            "MOTHBALL": '0.50"'
-        }
+    return threats
 
-        for size_name, size_value in hail_sizes.items():
-            if size_name in description_upper:
-                threats['hail'] = size_value
-                break
+THREAT_NUMBER_PATTERN = re.compile(r'(\d*\.?\d+)')
+KNOTS_TO_MPH = 1.15078
+
+class ThreatInfo:
+    """Typed threat summary for one alert: numbers in mph/inches plus the NWS threat tags"""
+    __slots__ = ("wind_gust_mph", "hail_size_in", "tornado_detection", "damage_threat", "wind_threat", "hail_threat")
+    
+    def __init__(self, wind_gust_mph=None, hail_size_in=None, tornado_detection=None, damage_threat=None,
+                 wind_threat=None, hail_threat=None):
+        self.wind_gust_mph = wind_gust_mph
+        self.hail_size_in = hail_size_in
+        self.tornado_detection = tornado_detection
+        self.damage_threat = damage_threat
+        self.wind_threat = wind_threat
+        self.hail_threat = hail_threat  # "RADAR INDICATED", "OBSERVED", ...
+    
+    @property
+    def wind_text(self):
+        return f"{self.wind_gust_mph} MPH" if self.wind_gust_mph else None
+    
+    @property
+    def hail_text(self):
+        return f'{self.hail_size_in:.2f}"' if self.hail_size_in else None
+    
+    def __repr__(self):
+        return f"ThreatInfo(wind={self.wind_text}, hail={self.hail_text}, tornado={self.tornado_detection}, damage={self.damage_threat})"
+
+def first_parameter(parameters, *names):
+    """First value of the first NWS parameter present, upper-cased (parameters are lists of strings)"""
+    for name in names:
+        if values := parameters.get(name):
+            return str(values[0]).strip().upper() or None
+    return None
 
-        # Additional check for any mention of hail without size
-        if not threats['hail'] and 'HAIL' in description_upper:
-            # Look for any number near the word hail
-            hail_nearby = re.search(r'HAIL.*?(\d*\.?\d+)', description_upper)
-            if not hail_nearby:
-                hail_nearby = re.search(r'(\d*\.?\d+).*?HAIL', description_upper)
-
-            if hail_nearby:
-                size = hail_nearby.group(1)
-                if size and float(size) < 10:  # Reasonable hail size
-                    threats['hail'] = f'{size}"'
-            else:
-                # If hail is mentioned but no size, assume small hail
-                threats['hail'] = '0.50"'
+def parse_wind_gust_mph(value):
+    """Wind gust in mph from "60 MPH", "UP TO 60 MPH" or marine "50 KTS" (None if not given)"""
+    if value and (match := THREAT_NUMBER_PATTERN.search(value)):
+        speed = float(match.group(1))
+        if 'KT' in value:
+            speed *= KNOTS_TO_MPH
+        return round(speed)
+    return None
 
+def parse_hail_size_in(value):
+    """Hail size in inches from "1.75", "UP TO .75", '1.75"' or "3/4"; 0.0 = explicitly no hail, None = not given"""
+    if not value:
+        return None
+    if '/' in value:
+        numerator, _, denominator = value.strip('"').partition('/')
+        try:
+            return round(int(numerator) / int(denominator), 2)
+        except (ValueError, ZeroDivisionError):
+            return None
+    if match := THREAT_NUMBER_PATTERN.search(value):
+        return float(match.group(1))
+    return None
+
+def build_threat_info(parameters, description):
+    """Build an alert's ThreatInfo from its NWS parameters, reading the description only for what they lack"""
+    threats = ThreatInfo(
+        wind_gust_mph=parse_wind_gust_mph(first_parameter(parameters, 'maxWindGust')),
+        hail_size_in=parse_hail_size_in(first_parameter(parameters, 'maxHailSize')),
+        tornado_detection=first_parameter(parameters, 'tornadoDetection'),
+        damage_threat=first_parameter(parameters, 'tornadoDamageThreat', 'thunderstormDamageThreat'),
+        wind_threat=first_parameter(parameters, 'windThreat'),
+        hail_threat=first_parameter(parameters, 'hailThreat')
+    )
+    
+    # Regex over the description is the last resort, only for values NWS didn't give at all
+    # (an explicit maxHailSize of 0.00 means "no hail", not "unknown")
+    if threats.wind_gust_mph is None or threats.hail_size_in is None:
+        text_threats = extract_threats_from_description(description)
+        if threats.wind_gust_mph is None and text_threats['wind']:
+            threats.wind_gust_mph = parse_wind_gust_mph(text_threats['wind'])
+        if threats.hail_size_in is None and text_threats['hail']:
+            threats.hail_size_in = parse_hail_size_in(text_threats['hail'])
+    
+    if threats.tornado_detection is None and description and 'TORNADO...' in description.upper():
+        threats.tornado_detection = parse_threat_tags(description.upper()).get('TORNADO') or None
+    
     return threats
 
-def get_population_from_nominatim(warning_feature):
+def load_population_index():
+    """Load the SAME/UGC code -> population table once at startup (empty if the file is missing)"""
+    index_path = os.path.join(os.path.dirname(__file__) or '.', CONFIG["POPULATION_INDEX_PATH"])
+    index = {}
+    try:
+        with open(index_path, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                index[row["code"]] = int(row["population"])
+        logger.info(f"Population index loaded: {len(index)} codes from {index_path}")
+    except FileNotFoundError:
+        logger.warning(f"No population index at {index_path}, falling back to online lookups")
+    except Exception as e:
+        logger.error(f"Error loading population index: {e}")
+    return index
+
+population_index = load_population_index()
+
+def get_population_from_index(alert):
+    """Sum the indexed population of an alert's counties (SAME) or, without SAME, its UGC counties/zones"""
+    for codes in (alert.geocode.get('SAME'), alert.geocode.get('UGC')):
+        populations = [population_index[code] for code in codes or [] if code in population_index]
+        if populations:
+            return sum(populations)
+    return 0
+
+RASTER_CHUNK_ROWS = 256  # Raster rows tested per pass, bounding memory for very large polygons
+
+def load_population_raster():
+    """Memory-map the population raster and its JSON header, or None if numpy or the files are missing"""
+    if np is None:
+        return None
+    raster_path = os.path.join(os.path.dirname(__file__) or '.', CONFIG["POPULATION_RASTER_PATH"])
+    try:
+        with open(os.path.splitext(raster_path)[0] + '.json', 'r') as f:
+            meta = json.load(f)
+        grid = np.load(raster_path, mmap_mode='r')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error loading population raster: {e}")
+        return None
+    logger.info(f"Population raster loaded: {grid.shape[0]}x{grid.shape[1]} cells of {meta['cell_size']} deg")
+    return {"grid": grid, "west": meta["west"], "north": meta["north"], "cell": meta["cell_size"]}
+
+population_raster = load_population_raster()
+
+def points_in_polygon(x, y, geometry):
+    """Vectorized even-odd test of coordinate arrays against a GeoJSON Polygon/MultiPolygon (holes included)"""
+    coords = geometry['coordinates']
+    rings = coords if geometry['type'] == 'Polygon' else [ring for polygon in coords for ring in polygon]
+    inside = np.zeros(x.shape, dtype=bool)
+    for ring in rings:
+        if len(ring) < 3:
+            continue
+        if ring[0] != ring[-1]:
+            ring = ring + [ring[0]]
+        for a, b in zip(ring[:-1], ring[1:]):
+            ax, ay, bx, by = a[0], a[1], b[0], b[1]
+            if ay == by:
+                continue
+            inside ^= ((ay > y) != (by > y)) & (x < (bx - ax) * (y - ay) / (by - ay) + ax)
+    return inside
+
+def get_population_from_raster(alert):
+    """Sum raster cells whose centers fall inside the warning polygon (0 if no raster or polygon)"""
+    raster = population_raster
+    geometry = alert.geometry
+    if raster is None or not geometry or geometry.get('type') not in ('Polygon', 'MultiPolygon'):
+        return 0
+    try:
+        bounds = get_geometry_bounds(geometry)
+        if bounds is None:
+            return 0
+        min_lon, min_lat, max_lon, max_lat = bounds
+        grid, cell, west, north = raster["grid"], raster["cell"], raster["west"], raster["north"]
+        
+        # Only the polygon's bounding window is read from the memory map
+        row0 = max(int((north - max_lat) / cell), 0)
+        row1 = min(int((north - min_lat) / cell) + 1, grid.shape[0])
+        col0 = max(int((min_lon - west) / cell), 0)
+        col1 = min(int((max_lon - west) / cell) + 1, grid.shape[1])
+        if row0 >= row1 or col0 >= col1:
+            return 0
+        
+        lons = west + (np.arange(col0, col1) + 0.5) * cell
+        total = 0.0
+        for start in range(row0, row1, RASTER_CHUNK_ROWS):
+            stop = min(start + RASTER_CHUNK_ROWS, row1)
+            lats = north - (np.arange(start, stop) + 0.5) * cell
+            x, y = np.meshgrid(lons, lats)
+            inside = points_in_polygon(x, y, geometry)
+            if inside.any():
+                total += float(np.asarray(grid[start:stop, col0:col1], dtype=np.float64)[inside].sum())
+        return int(round(total))
+    except Exception as e:
+        logger.error(f"Error summing population raster for {alert.id}: {e}")
+        return 0
+
+def load_population_places():
+    """Load the persisted population points and bulk-load them into an STRtree (None if not built)"""
+    places_path = os.path.join(os.path.dirname(__file__) or '.', CONFIG["POPULATION_PLACES_PATH"])
+    try:
+        with open(places_path, 'rb') as f:
+            data = pickle.load(f)
+        points = [Point(lon, lat) for lon, lat in zip(data["lons"], data["lats"])]
+        tree = STRtree(points)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error loading population places: {e}")
+        return None
+    logger.info(f"Population places loaded: {len(points)} points")
+    return {
+        "tree": tree,
+        "points": points,
+        "populations": data["populations"],
+        "index_by_id": {id(point): i for i, point in enumerate(points)}  # Shapely 1.x queries return geometries
+    }
+
+population_places = load_population_places()
+
+def get_population_from_places(alert):
+    """Sum the population points inside the warning polygon (0 if no places index or polygon)"""
+    places = population_places
+    if places is None or not alert.geometry:
+        return 0
+    try:
+        polygon = shape(alert.geometry)
+        prepared = prep(polygon)
+        total = 0
+        # The tree narrows to points in the polygon's bounding box; the prepared polygon does the exact test
+        for candidate in places["tree"].query(polygon):
+            index = places["index_by_id"][id(candidate)] if hasattr(candidate, 'geom_type') else int(candidate)
+            if prepared.contains(places["points"][index]):
+                total += places["populations"][index]
+        return total
+    except Exception as e:
+        logger.error(f"Error querying population places for {alert.id}: {e}")
+        return 0
+
+def get_population_from_nominatim(alert):
     """Get population data using OpenStreetMap Nominatim API"""
     try:
-        geometry = warning_feature.get('geometry')
+        geometry = alert.geometry
         if not geometry:
             return 0
             
@@ -1332,7 +2049,7 @@ def get_population_from_nominatim(warning_feature):
         }
         
         headers = {'User-Agent': 'WeatherWarningScript/1.0'}
-        response = requests.get(url, params=params, headers=headers, timeout=5)
+        response = http_get(url, params=params, headers=headers, timeout=5)
         
         if response.status_code == 200:
             data = response.json()
@@ -1371,47 +2088,169 @@ def estimate_population_simple(polygon):
         logger.error(f"Error in simple population estimate: {e}")
         return 0
 
-def get_warning_population(warning_feature):
-    """Get population for warning area using multiple methods"""
+POPULATION_CACHE_PRECISION = 3  # Decimal places kept when hashing polygons (~100 m)
+POPULATION_CACHE_EVICT_EVERY = 100  # Check the size limit after this many inserts
+
+def get_population_cache_key(alert):
+    """Hash of the warning polygon with coordinates rounded, or of its county/zone codes when it has none"""
+    geometry = alert.geometry
+    if geometry and geometry.get('coordinates'):
+        def simplify(coords):
+            if coords and isinstance(coords[0], (int, float)):
+                return [round(value, POPULATION_CACHE_PRECISION) for value in coords[:2]]
+            return [simplify(c) for c in coords]
+        payload = json.dumps([geometry.get('type'), simplify(geometry['coordinates'])], separators=(',', ':'))
+    else:
+        codes = alert.geocode.get('SAME') or alert.geocode.get('UGC')
+        if not codes:
+            return None
+        payload = "codes:" + ",".join(sorted(codes))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+class PopulationCache:
+    """SQLite-backed population results (and the method that produced them) keyed by polygon hash, with a TTL and LRU size limit"""
+    
+    def __init__(self, path, ttl, max_entries):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.conn = None
+        self.lock = threading.Lock()
+        self.inserts = 0
+    
+    def _connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(population_cache)")]
+            if columns and "method" not in columns:
+                # Older caches can't tell flat-density guesses from real lookups, so start over
+                with self.conn:
+                    self.conn.execute("DROP TABLE population_cache")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS population_cache ("
+                "key TEXT PRIMARY KEY, population INTEGER, method TEXT, created REAL, last_used REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_population_cache_last_used ON population_cache (last_used)")
+            self._evict()
+        return self.conn
+    
+    def _evict(self):
+        """Drop expired rows, then the least recently used rows beyond the size limit"""
+        with self.conn:
+            self.conn.execute("DELETE FROM population_cache WHERE created < ?", (time.time() - self.ttl,))
+            self.conn.execute(
+                "DELETE FROM population_cache WHERE key IN ("
+                "SELECT key FROM population_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+    
+    def get(self, key):
+        try:
+            with self.lock:
+                conn = self._connect()
+                now = time.time()
+                row = conn.execute(
+                    "SELECT population, method FROM population_cache WHERE key = ? AND created >= ?", (key, now - self.ttl)
+                ).fetchone()
+                if row is None:
+                    return None
+                with conn:
+                    conn.execute("UPDATE population_cache SET last_used = ? WHERE key = ?", (now, key))
+                return row
+        except Exception as e:
+            logger.error(f"Population cache read failed: {e}")
+            return None
+    
+    def put(self, key, population, method):
+        try:
+            with self.lock:
+                conn = self._connect()
+                now = time.time()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO population_cache (key, population, method, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                        (key, population, method, now, now)
+                    )
+                self.inserts += 1
+                if self.inserts % POPULATION_CACHE_EVICT_EVERY == 0:
+                    self._evict()
+        except Exception as e:
+            logger.error(f"Population cache write failed: {e}")
+
+population_cache = PopulationCache(
+    os.path.join(os.path.dirname(__file__) or '.', CONFIG["POPULATION_CACHE_PATH"]),
+    CONFIG["POPULATION_CACHE_TTL_SECONDS"],
+    CONFIG["POPULATION_CACHE_MAX_ENTRIES"]
+)
+
+def get_warning_population(alert):
+    """Get population for warning area (memoized per alert)"""
+    return alert_analysis_cache.get(alert.id, alert.description, "population", lambda: get_cached_population(alert))
+
+def get_cached_population(alert):
+    """Population from the on-disk cache when the same polygon was seen before, else looked up and stored"""
+    key = get_population_cache_key(alert)
+    if key is None:
+        return lookup_warning_population(alert)[0]
+    cached = population_cache.get(key)
+    if cached is None:
+        population, method = lookup_warning_population(alert)
+        # Flat-density guesses and failures (0) aren't worth keeping, and only live alerts are
+        # stored so replays and synthetic load tests leave the cache as they found it
+        if method in POPULATION_METHODS and alert_source.name == "nws":
+            population_cache.put(key, population, method)
+        return population
+    
+    population, method = cached
+    # A local source installed since this was cached beats it (Nominatim is never re-queried)
+    better = POPULATION_LOOKUPS[:POPULATION_METHODS.index(method)] if method in POPULATION_METHODS else ()
+    better_population, better_method = lookup_warning_population(alert, better, estimate=False)
+    if better_method:
+        if alert_source.name == "nws":
+            population_cache.put(key, better_population, better_method)
+        return better_population
+    return population
+
+def get_population_from_nws(alert):
+    """Population NWS published with the alert (0 if none)"""
+    nws_pop = alert.parameters.get('population', [None])[0]
+    return int(nws_pop) if nws_pop and nws_pop > 0 else 0
+
+# Population lookups, best first: NWS's own figure, then the polygon against the local raster
+# and population points, the offline county/zone table, and finally Nominatim's centroid figure
+POPULATION_LOOKUPS = (
+    ("nws", get_population_from_nws),
+    ("raster", get_population_from_raster),
+    ("places", get_population_from_places),
+    ("index", get_population_from_index),
+    ("nominatim", get_population_from_nominatim)
+)
+POPULATION_METHODS = tuple(method for method, _ in POPULATION_LOOKUPS)
+
+def lookup_warning_population(alert, lookups=POPULATION_LOOKUPS, estimate=True):
+    """Return (population, method) from the first lookup that finds anyone, else a geometric estimate"""
     try:
-        props = warning_feature.get('properties', {})
-        params = props.get('parameters', {})
-        
-        # First, try NWS provided population
-        nws_pop = params.get('population', [None])[0]
-        if nws_pop and nws_pop > 0:
-            return int(nws_pop)
-        
-        # Try Nominatim
-        nominatim_pop = get_population_from_nominatim(warning_feature)
-        if nominatim_pop > 0:
-            return nominatim_pop
-            
+        for method, lookup in lookups:
+            population = lookup(alert)
+            if population and population > 0:
+                return population, method
+        
         # Fall back to geometric estimation
-        geometry = warning_feature.get('geometry')
-        if geometry:
-            return estimate_population_simple(shape(geometry))
-            
-        return 0
+        if estimate and alert.geometry:
+            return estimate_population_simple(shape(alert.geometry)), "estimate"
+        
+        return 0, None
         
     except Exception as e:
         logger.error(f"Error getting warning population: {e}")
-        return 0
+        return 0, None
 
 # Add these helper functions
-def is_pds_warning(warning_feature):
-    """Check if a warning is a PDS warning"""
-    props = warning_feature.get('properties', {})
-    headline = props.get('headline', '').upper()
-    description = props.get('description', '').upper()
-    return "PARTICULARLY DANGEROUS SITUATION" in headline or "PARTICULARLY DANGEROUS SITUATION" in description
-
-def get_warning_duration(warning_feature):
+def get_warning_duration(alert):
     """Get the display duration for a warning based on its type and PDS status"""
-    props = warning_feature.get('properties', {})
-    event_type = props.get('event', 'Unknown')
+    event_type = alert.event
     
-    if is_pds_warning(warning_feature) and event_type == "Tornado Warning":
+    if alert.is_pds and event_type == "Tornado Warning":
         return WARNING_DURATIONS["PDS"]
     elif event_type in WARNING_DURATIONS:
         return WARNING_DURATIONS[event_type]
@@ -1434,65 +2273,938 @@ def check_for_new_high_priority_warnings():
         if i >= current_index:
             break
             
-        props = warning.get('properties', {})
-        event_type = props.get('event', '')
-        
         # If it's a tornado warning (PDS or regular) that appeared since our last cycle
-        if event_type == "Tornado Warning":
-            # Check if this is a truly NEW warning by comparing timestamps
-            warning_time = props.get('sent', '')
-            if warning_time and last_action_timestamp > 0:
-                try:
-                    warning_dt = datetime.fromisoformat(warning_time.replace('Z', '+00:00'))
-                    last_action_dt = datetime.fromtimestamp(last_action_timestamp, tz=timezone.utc)
-                    
-                    # If this warning was issued after our last action, it's new
-                    if warning_dt > last_action_dt:
-                        logger.info(f"Found NEW high-priority warning: {event_type}{' (PDS)' if is_pds_warning(warning) else ''}")
-                        return True
-                except:
-                    pass
+        if warning.event == "Tornado Warning":
+            # Check if this is a truly NEW warning: issued after our last action
+            if warning.issued and last_action_timestamp > 0 and warning.issued > last_action_timestamp:
+                logger.info(f"Found NEW high-priority warning: {warning.event}{' (PDS)' if warning.is_pds else ''}")
+                return True
     
     return False
 
-rate_limit(min_interval=1.0)
-def get_and_sort_active_warnings():
-    """Fetch active warnings from NWS API and sort by priority"""
-    try:
-        r = requests.get(NWS_API_URL, headers=NWS_API_HEADERS, timeout=15)
-        r.raise_for_status()
-
-        # Filter for tornado and severe thunderstorm warnings only
-        warnings = [
-            f for f in r.json().get('features', [])
-            if f.get('properties', {}).get('status') == "Actual" and not is_warning_expired(f) and
-               f.get('properties', {}).get('event') in ["Tornado Warning", "Severe Thunderstorm Warning"]
-        ]
-        
-        # Sort by priority: PDS Tornado (0), Regular Tornado (1), PDS Severe T-storm (2), Regular Severe T-storm (3)
-        def get_priority(warning):
-            props = warning.get('properties', {})
-            event_type = props.get('event', '')
-            is_pds = is_pds_warning(warning)
-            
-            if event_type == "Tornado Warning":
-                return 0 if is_pds else 1
-            elif event_type == "Severe Thunderstorm Warning":
-                return 2 if is_pds else 3
-            else:
-                return 4  # Fallback for any other warning types
+def build_nws_query_params():
+    """Build the server-side filter parameters for the NWS alerts endpoint from config"""
+    if not CONFIG["NWS_SERVER_SIDE_FILTER"]:
+        return {}
+    
+    params = {"status": "actual"}
+    if CONFIG["NWS_ALERT_EVENTS"]:
+        params["event"] = ",".join(CONFIG["NWS_ALERT_EVENTS"])
+    if CONFIG["NWS_MESSAGE_TYPES"]:
+        params["message_type"] = ",".join(CONFIG["NWS_MESSAGE_TYPES"])
+    if CONFIG["NWS_AREA_FILTER"]:
+        params["area"] = ",".join(state.upper() for state in CONFIG["NWS_AREA_FILTER"])
+    return params
+
+def request_nws_alerts(params):
+    """GET the NWS active alerts endpoint, using conditional headers when the query is unchanged"""
+    headers = dict(NWS_API_HEADERS)
+    if CONFIG["NWS_CONDITIONAL_GET"] and nws_poll_cache["params"] == params:
+        if nws_poll_cache["etag"]:
+            headers["If-None-Match"] = nws_poll_cache["etag"]
+        if nws_poll_cache["last_modified"]:
+            headers["If-Modified-Since"] = nws_poll_cache["last_modified"]
+    
+    r = http_get(NWS_API_URL, params=params, headers=headers, timeout=15, stream=True)
+    if r.status_code != 304:
+        try:
+            r.raise_for_status()
+        except Exception:
+            r.close()
+            raise
+    return r
+
+def record_nws_freshness(headers):
+    """Remember how long NWS says its response stays fresh (Cache-Control max-age, else Expires)"""
+    global nws_fresh_until
+    now = time.time()
+    if match := re.search(r'max-age=(\d+)', headers.get("Cache-Control", "")):
+        try:
+            age = int(headers.get("Age", 0))
+        except ValueError:
+            age = 0
+        nws_fresh_until = now + max(int(match.group(1)) - age, 0)
+    elif expires := headers.get("Expires"):
+        try:
+            nws_fresh_until = parsedate_to_datetime(expires).timestamp()
+        except Exception:
+            nws_fresh_until = now
+    else:
+        nws_fresh_until = now
+
+def iter_nws_features(response):
+    """Yield alert features one at a time, streaming the body when ijson is available"""
+    if ijson is not None and CONFIG["NWS_STREAMING_PARSER"]:
+        response.raw.decode_content = True  # Let urllib3 undo gzip before ijson sees the bytes
+        yield from ijson.items(response.raw, 'features.item', use_float=True)
+    else:
+        yield from response.json().get('features', [])
+
+def parse_nws_alerts(features, now):
+    """Build Alert records for the features we keep, dropping everything else as it streams past"""
+    events = set(CONFIG["NWS_ALERT_EVENTS"])
+    for feature in features:
+        props = feature.get('properties') or {}
         
-        warnings.sort(key=lambda w: (get_priority(w), w['properties']['sent']))
+        # Cheap checks on the raw feature first so discarded alerts never become Alert records
+        if props.get('status') != "Actual" or props.get('event') not in events:
+            continue
         
+        alert = Alert(feature)
+        if not is_warning_expired(alert, now) and is_in_area_filter(alert) and is_in_region_of_interest(alert):
+            yield alert
+
+def is_in_area_filter(alert):
+    """Check if a warning covers one of the configured states (client-side equivalent of area=)"""
+    if not CONFIG["NWS_AREA_FILTER"]:
+        return True
+    states = {state.upper() for state in CONFIG["NWS_AREA_FILTER"]}
+    ugc_codes = alert.geocode.get('UGC', [])
+    return any(code[:2] in states for code in ugc_codes)
+
+def load_region_of_interest():
+    """Compile the configured region of interest once, or return None to monitor the whole country"""
+    roi = CONFIG["REGION_OF_INTEREST"]
+    states = {state.upper() for state in roi.get("states") or []}
+    cwas = {cwa.upper()[-3:] for cwa in roi.get("cwas") or []}  # Accept "OUN" or "KOUN"
+    polygon = None
+    bounds = None
+    
+    if roi.get("geojson"):
+        geojson_path = os.path.join(os.path.dirname(__file__) or '.', roi["geojson"])
+        try:
+            with open(geojson_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('type') == 'FeatureCollection':
+                geometries = [feature.get('geometry') for feature in data.get('features', [])]
+            elif data.get('type') == 'Feature':
+                geometries = [data.get('geometry')]
+            else:
+                geometries = [data]
+            region = unary_union([shape(geometry) for geometry in geometries if geometry])
+            polygon = prep(region)
+            bounds = region.bounds
+        except Exception as e:
+            logger.error(f"Could not load region of interest from {geojson_path}: {e}")
+    
+    if not (states or cwas or polygon):
+        return None
+    logger.info(f"Region of interest: states={sorted(states)}, CWAs={sorted(cwas)}, polygon={'yes' if polygon else 'no'}")
+    return {"states": states, "cwas": cwas, "polygon": polygon, "bounds": bounds}
+
+def get_geometry_bounds(geometry):
+    """Bounding box of a GeoJSON geometry read straight from its coordinates (no shapely object needed)"""
+    coords = geometry.get('coordinates') or []
+    if geometry.get('type') == 'Polygon':
+        points = [point for ring in coords for point in ring]
+    elif geometry.get('type') == 'MultiPolygon':
+        points = [point for polygon in coords for ring in polygon for point in ring]
+    else:
+        return shape(geometry).bounds
+    if not points:
+        return None
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def is_in_region_of_interest(alert):
+    """Check a warning against the region of interest: any matching state, CWA or polygon keeps it"""
+    roi = region_of_interest
+    if roi is None:
+        return True
+    if roi["states"] and any(code[:2] in roi["states"] for code in alert.geocode.get('UGC', [])):
+        return True
+    if roi["cwas"] and alert.vtec_key and alert.vtec_key[0][-3:] in roi["cwas"]:
+        return True
+    if roi["polygon"] is None:
+        return False
+    if not alert.geometry:
+        # Zone-based alerts have no polygon to test; keep them unless a state/CWA list already ruled them out
+        return not (roi["states"] or roi["cwas"])
+    
+    # Bounding-box prefilter rejects most of the country before shapely builds a geometry
+    alert_bounds = get_geometry_bounds(alert.geometry)
+    if alert_bounds is None:
+        return False
+    min_x, min_y, max_x, max_y = roi["bounds"]
+    if alert_bounds[0] > max_x or alert_bounds[2] < min_x or alert_bounds[1] > max_y or alert_bounds[3] < min_y:
+        return False
+    try:
+        return roi["polygon"].intersects(shape(alert.geometry))
+    except Exception as e:
+        logger.error(f"Error testing {alert.id} against the region of interest: {e}")
+        return True
+
+region_of_interest = load_region_of_interest()
+
+def read_alert_feed():
+    """Read the shared alert feed snapshot, or None if the daemon isn't publishing"""
+    feed_path = os.path.join(os.path.dirname(__file__) or '.', CONFIG["ALERT_FEED_PATH"])
+    try:
+        with open(feed_path, 'r', encoding='utf-8') as f:
+            feed = json.load(f)
+        if time.time() - feed.get("updated", 0) > CONFIG["ALERT_FEED_MAX_AGE_SECONDS"]:
+            logger.warning("Alert feed snapshot is stale, calling NWS directly")
+            return None
+        return feed
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error reading alert feed: {e}")
+        return None
+
+def get_warnings_from_alert_feed(feed):
+    """Turn an alert feed snapshot into sorted warnings, reusing the last result if unchanged"""
+    global nws_poll_cache
+    if feed["sequence"] == nws_poll_cache["feed_sequence"]:
+        return list(nws_poll_cache["warnings"])
+    
+    warnings = list(parse_nws_alerts(feed.get("features", []), time.time()))
+    warnings.sort(key=lambda w: w.sort_key)
+    nws_poll_cache = {
+        "feed_sequence": feed["sequence"],
+        "params": None,
+        "etag": None,
+        "last_modified": None,
+        "warnings": warnings
+    }
+    return list(warnings)
+
+# --- NWS circuit breaker: "closed" (normal), "open" (backing off), "half_open" (one trial call) ---
+nws_breaker = {
+    "state": "closed",
+    "failures": 0,
+    "retry_at": 0,
+    "last_success": 0
+}
+
+def nws_breaker_allows_request():
+    """Check whether the breaker lets us call NWS right now"""
+    if nws_breaker["state"] == "open":
+        if time.time() < nws_breaker["retry_at"]:
+            return False
+        nws_breaker["state"] = "half_open"
+        logger.info("NWS circuit breaker half-open, trying one request")
+    return True
+
+def record_nws_success():
+    """Close the breaker after a good NWS response"""
+    if nws_breaker["state"] != "closed":
+        logger.info("NWS circuit breaker closed, API is reachable again")
+    nws_breaker.update(state="closed", failures=0, retry_at=0, last_success=time.time())
+
+def record_nws_failure():
+    """Count a failed NWS call and open the breaker with exponential backoff once over the threshold"""
+    nws_breaker["failures"] += 1
+    over_threshold = nws_breaker["failures"] - CONFIG["NWS_BREAKER_FAILURE_THRESHOLD"]
+    if over_threshold >= 0 or nws_breaker["state"] == "half_open":
+        backoff = min(CONFIG["NWS_BREAKER_BACKOFF_SECONDS"] * (2 ** max(over_threshold, 0)),
+                      CONFIG["NWS_BREAKER_MAX_BACKOFF_SECONDS"])
+        nws_breaker.update(state="open", retry_at=time.time() + backoff)
+        logger.warning(f"NWS circuit breaker open after {nws_breaker['failures']} failure(s), retrying in {backoff:.0f}s")
+
+def get_nws_staleness():
+    """Seconds since the last good NWS response (None if there never was one)"""
+    if not nws_breaker["last_success"]:
+        return None
+    return time.time() - nws_breaker["last_success"]
+
+def get_nws_breaker_status():
+    """Breaker state and data staleness for the state file"""
+    staleness = get_nws_staleness()
+    return {
+        "breaker_state": nws_breaker["state"],
+        "consecutive_failures": nws_breaker["failures"],
+        "retry_at": nws_breaker["retry_at"] or None,
+        "last_success": nws_breaker["last_success"] or None,
+        "staleness_seconds": round(staleness, 1) if staleness is not None else None
+    }
+
+def get_and_sort_active_warnings():
+    """Fetch active warnings from the alert source, sorted by priority (None if it could not be reached)"""
+    if not nws_breaker_allows_request():
+        return None
+    try:
+        warnings = alert_source.fetch()
+        record_nws_success()
         return warnings
     except Exception as e:
         logger.error(f"NWS API call failed: {e}")
-        return []
+        record_nws_failure()
+        return None
+
+def fetch_and_sort_active_warnings():
+    """Fetch and sort active warnings, raising on any failure"""
+    global nws_poll_cache
+    if CONFIG["USE_ALERT_FEED"] and (feed := read_alert_feed()) is not None:
+        return get_warnings_from_alert_feed(feed)
+    
+    params = build_nws_query_params()
+    try:
+        r = request_nws_alerts(params)
+    except requests.HTTPError as e:
+        # Only a rejected filtered query is worth retrying unfiltered; connection errors, timeouts
+        # and rate limiting would fail again, so they go straight to the breaker
+        if not params:
+            raise
+        logger.warning(f"Filtered NWS query failed ({e}), falling back to the unfiltered feed")
+        params = {}
+        r = request_nws_alerts(params)
+    
+    record_nws_freshness(r.headers)
+    with r:
+        # Nothing changed since the last poll - reuse the already parsed and sorted warnings
+        if r.status_code == 304:
+            logger.debug("NWS alerts not modified (304), reusing previous result")
+            return list(nws_poll_cache["warnings"])
+        
+        # Filter for the configured warning types (the server has usually done this already)
+        warnings = list(parse_nws_alerts(iter_nws_features(r), time.time()))
+    
+    # Sort by priority: PDS Tornado (0), Regular Tornado (1), PDS Severe T-storm (2), Regular Severe T-storm (3)
+    warnings.sort(key=lambda w: w.sort_key)
+    
+    if CONFIG["NWS_CONDITIONAL_GET"]:
+        nws_poll_cache = {
+            "feed_sequence": None,
+            "params": params,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "warnings": warnings
+        }
+    
+    return list(warnings)
+
+# ========================================================================================
+# --- ALERT SOURCES ---
+# ========================================================================================
+# Everything downstream of get_and_sort_active_warnings() only sees sorted Alert lists, so
+# recorded and synthetic inputs can stand in for NWS. Replayed alerts are re-timed onto the
+# wall clock (scaled by the replay speed) so expiry, rotation and scoring behave as live.
+class AlertSource(ABC):
+    """Base class for alert sources: fetch() returns warnings sorted by sort_key, or raises"""
+    name = "base"
+    
+    @abstractmethod
+    def fetch(self):
+        """Return the currently active warnings, sorted by sort_key"""
+    
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+class NWSAlertSource(AlertSource):
+    """Live NWS API (or the shared alert feed daemon when USE_ALERT_FEED is on)"""
+    name = "nws"
+    
+    def fetch(self):
+        return fetch_and_sort_active_warnings()
+
+def format_nws_timestamp(epoch):
+    """Format epoch seconds the way NWS timestamps are written"""
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat()
+
+def retime_feature(feature, origin, wall_origin, speed):
+    """Copy a recorded feature with sent/expires moved so `origin` lands on `wall_origin`, `speed` times faster"""
+    props = dict(feature.get('properties') or {})
+    for field in ('sent', 'expires'):
+        if timestamp := parse_nws_timestamp(props.get(field) or ''):
+            props[field] = format_nws_timestamp(wall_origin + (timestamp - origin) / speed)
+    return {**feature, "properties": props}
+
+def sort_replayed_features(features):
+    """Parse replayed features through the normal ingest filters and sort them"""
+    warnings = list(parse_nws_alerts(features, time.time()))
+    warnings.sort(key=lambda w: w.sort_key)
+    return warnings
+
+def get_snapshot_time(snapshot, path):
+    """When a recorded snapshot was taken: its "updated", else its newest "sent", else the file's mtime"""
+    updated = snapshot.get("updated")
+    if isinstance(updated, (int, float)):  # Alert feed files record epoch seconds
+        return float(updated)
+    if updated and (timestamp := parse_nws_timestamp(updated)):  # NWS responses record ISO 8601
+        return timestamp
+    newest_sent = max((parse_nws_timestamp((feature.get('properties') or {}).get('sent') or '')
+                       for feature in snapshot.get('features', [])), default=0.0)
+    return newest_sent or os.path.getmtime(path)
+
+class SnapshotDirectoryAlertSource(AlertSource):
+    """Replays a directory of recorded GeoJSON snapshots (NWS responses or alert feed files) at `speed` times real time"""
+    name = "directory"
+    
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        snapshots = []
+        for filename in os.listdir(path):
+            if filename.endswith('.json'):
+                file_path = os.path.join(path, filename)
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    snapshots.append((get_snapshot_time(json.load(f), file_path), filename))
+        if not snapshots:
+            raise ValueError(f"No .json snapshots in {path}")
+        snapshots.sort()
+        self.snapshot_times = [snapshot_time for snapshot_time, _ in snapshots]
+        self.files = [filename for _, filename in snapshots]
+        self.wall_origin = None
+        self.loaded = (None, [])  # (index, features) of the snapshot read last
+    
+    def fetch(self):
+        now = time.time()
+        if self.wall_origin is None:
+            self.wall_origin = now
+        origin = self.snapshot_times[0]
+        replay_time = origin + (now - self.wall_origin) * self.speed
+        index = max(bisect.bisect_right(self.snapshot_times, replay_time) - 1, 0)
+        
+        if self.loaded[0] != index:
+            with open(os.path.join(self.path, self.files[index]), 'r', encoding='utf-8') as f:
+                self.loaded = (index, json.load(f).get('features', []))
+        return sort_replayed_features([retime_feature(feature, origin, self.wall_origin, self.speed) for feature in self.loaded[1]])
+    
+    def __repr__(self):
+        return f"SnapshotDirectoryAlertSource({self.path!r}, {len(self.files)} snapshots, {self.speed}x)"
+
+class ArchiveReplayAlertSource(AlertSource):
+    """Replays the snapshots recorded in the alert archive at `speed` times real time"""
+    name = "archive"
+    
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = speed
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        rows = self.conn.execute("SELECT time, alert_ids FROM snapshots ORDER BY time").fetchall()
+        if not rows:
+            raise ValueError(f"No snapshots recorded in {path}")
+        self.snapshot_times = [row[0] for row in rows]
+        self.snapshot_ids = [json.loads(row[1]) for row in rows]
+        self.features = {}
+        self.wall_origin = None
+    
+    def get_feature(self, alert_id):
+        if alert_id not in self.features:
+            row = self.conn.execute("SELECT feature FROM alerts WHERE id = ?", (alert_id,)).fetchone()
+            self.features[alert_id] = json.loads(zlib.decompress(row[0])) if row else None
+        return self.features[alert_id]
+    
+    def fetch(self):
+        now = time.time()
+        if self.wall_origin is None:
+            self.wall_origin = now
+        origin = self.snapshot_times[0]
+        archive_time = origin + (now - self.wall_origin) * self.speed
+        index = max(bisect.bisect_right(self.snapshot_times, archive_time) - 1, 0)
+        
+        features = [self.get_feature(alert_id) for alert_id in self.snapshot_ids[index]]
+        return sort_replayed_features([retime_feature(feature, origin, self.wall_origin, self.speed) for feature in features if feature])
+    
+    def __repr__(self):
+        return f"ArchiveReplayAlertSource({self.path!r}, {len(self.snapshot_times)} snapshots, {self.speed}x)"
+
+class SyntheticAlertSource(AlertSource):
+    """Generates an outbreak of storm-based warnings for offline load tests"""
+    name = "synthetic"
+    
+    COUNTIES = [
+        ("Oklahoma", "OK", "OUN", -97.5, 35.5), ("Cleveland", "OK", "OUN", -97.3, 35.2),
+        ("Tulsa", "OK", "TSA", -96.0, 36.1), ("Sedgwick", "KS", "ICT", -97.4, 37.7),
+        ("Shawnee", "KS", "TOP", -95.8, 39.0), ("Lancaster", "NE", "OAX", -96.7, 40.8),
+        ("Polk", "IA", "DMX", -93.6, 41.7), ("Dallas", "TX", "FWD", -96.8, 32.8),
+        ("Jefferson", "AL", "BMX", -86.9, 33.6), ("Hinds", "MS", "JAN", -90.4, 32.3),
+        ("Shelby", "TN", "MEG", -89.9, 35.2), ("Sangamon", "IL", "ILX", -89.7, 39.8)
+    ]
+    
+    def __init__(self, count=200, seed=None):
+        self.count = count
+        self.random = random.Random(seed)
+        self.features = []
+        self.etn = 0
+    
+    def make_feature(self, now):
+        county, state, office, lon, lat = self.random.choice(self.COUNTIES)
+        is_tornado = self.random.random() < 0.3
+        event = "Tornado Warning" if is_tornado else "Severe Thunderstorm Warning"
+        is_pds = is_tornado and self.random.random() < 0.05
+        duration = self.random.choice([30, 45, 60]) * 60
+        self.etn += 1
+        
+        lon += self.random.uniform(-0.5, 0.5)
+        lat += self.random.uniform(-0.5, 0.5)
+        size = self.random.uniform(0.1, 0.4)
+        polygon = [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+        
+        gust = self.random.choice([60, 70, 80]) if not is_tornado else 60
+        hail = self.random.choice([1.00, 1.25, 1.75, 2.50])
+        phenomenon = "TO" if is_tornado else "SV"
+        start = datetime.fromtimestamp(now, timezone.utc).strftime('%y%m%dT%H%MZ')
+        end = datetime.fromtimestamp(now + duration, timezone.utc).strftime('%y%m%dT%H%MZ')
+        
+        parameters = {
+            "VTEC": [f"/O.NEW.K{office}.{phenomenon}.W.{self.etn % 10000:04d}.{start}-{end}/"],
+            "maxWindGust": [f"{gust} MPH"],
+            "maxHailSize": [f"{hail:.2f}"]
+        }
+        if is_tornado:
+            parameters["tornadoDetection"] = [self.random.choice(["RADAR INDICATED", "OBSERVED"])]
+        
+        headline = f"{event} issued for {county} County, {state}"
+        description = (f"A severe thunderstorm capable of producing {'a tornado' if is_tornado else 'damaging winds'}."
+                       f"\n\nHAZARD...{gust} mph wind gusts and {hail:.2f} inch hail.")
+        if is_pds:
+            description += "\n\nThis is a PARTICULARLY DANGEROUS SITUATION."
+        
+        return {
+            "id": f"urn:oid:synthetic.{self.etn}",
+            "geometry": {"type": "Polygon", "coordinates": [polygon]},
+            "properties": {
+                "id": f"urn:oid:synthetic.{self.etn}",
+                "event": event,
+                "status": "Actual",
+                "messageType": "Alert",
+                "severity": "Extreme" if is_pds else "Severe",
+                "certainty": "Observed" if is_tornado else "Likely",
+                "headline": headline,
+                "description": description,
+                "areaDesc": f"{county}, {state}",
+                "parameters": parameters,
+                "geocode": {"UGC": [f"{state}C{self.random.randint(1, 199):03d}"]},
+                "references": [],
+                "sent": format_nws_timestamp(now),
+                "expires": format_nws_timestamp(now + duration)
+            }
+        }
+    
+    def fetch(self):
+        now = time.time()
+        self.features = [f for f in self.features if parse_nws_timestamp(f["properties"]["expires"]) > now]
+        # Issue a burst of new warnings each poll until the outbreak reaches its target size
+        new_count = min(self.count - len(self.features), max(1, self.count // 10))
+        self.features.extend(self.make_feature(now) for _ in range(max(new_count, 0)))
+        return sort_replayed_features(self.features)
+    
+    def __repr__(self):
+        return f"SyntheticAlertSource({self.count} warnings)"
+
+def create_alert_source():
+    """Build the alert source selected by ALERT_SOURCE, exiting if an offline source can't be set up"""
+    source_name = CONFIG["ALERT_SOURCE"]
+    path = CONFIG["ALERT_SOURCE_PATH"]
+    speed = CONFIG["ALERT_REPLAY_SPEED"] or 1.0
+    try:
+        if source_name == "directory":
+            source = SnapshotDirectoryAlertSource(path, speed)
+        elif source_name == "archive":
+            source = ArchiveReplayAlertSource(path, speed)
+        elif source_name == "synthetic":
+            source = SyntheticAlertSource(CONFIG["SYNTHETIC_ALERT_COUNT"])
+        else:
+            source = NWSAlertSource()
+    except Exception as e:
+        # Never fall back to live NWS: an offline replay or load test must not quietly hit the API
+        logger.critical(f"Could not set up '{source_name}' alert source: {e}")
+        sys.exit(1)
+    logger.info(f"Alert source: {source!r}")
+    return source
+
+alert_source = create_alert_source()
+
+# ========================================================================================
+# --- ALERT ARCHIVE ---
+# ========================================================================================
+# Append-only record of every alert we ingest. Alert features are stored zlib-compressed
+# (cancels and superseded messages included), lifecycle changes come from alert_store, and
+# the IDs each poll ingested are snapshotted whenever they change so a replay feeds the store
+# exactly what NWS sent. Each poll becomes one batch written in a single transaction on its
+# own thread.
+ALERT_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    id TEXT PRIMARY KEY,
+    event TEXT,
+    sent REAL,
+    expires REAL,
+    feature BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_event ON alerts (event);
+CREATE INDEX IF NOT EXISTS idx_alerts_sent ON alerts (sent);
+CREATE TABLE IF NOT EXISTS alert_states (
+    alert_id TEXT,
+    state TEXT,
+    PRIMARY KEY (alert_id, state)
+);
+CREATE INDEX IF NOT EXISTS idx_alert_states_state ON alert_states (state);
+CREATE TABLE IF NOT EXISTS lifecycle (
+    time REAL,
+    event TEXT,
+    alert_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_lifecycle_alert ON lifecycle (alert_id);
+CREATE INDEX IF NOT EXISTS idx_lifecycle_time ON lifecycle (time);
+CREATE TABLE IF NOT EXISTS snapshots (
+    time REAL,
+    alert_ids TEXT,
+    score REAL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots (time);
+"""
+
+alert_archive_queue = queue.Queue()
+alert_archive_thread = None
+alert_archive_lock = threading.Lock()
+alert_archive_pending_changes = []  # (time, event, alert_id) collected between polls
+alert_archive_pending_alerts = []   # Alerts ingested since the last batch, before the store filtered them
+alert_archive_pending_feed_ids = None  # IDs the latest poll ingested (None if it fetched nothing)
+alert_archive_known_ids = set()     # Alerts already queued for the alerts table
+alert_archive_last_ids = None       # Ingested IDs of the last archived snapshot
+
+def record_alert_change(event, alert):
+    """alert_store subscriber: remember a lifecycle change until the next archive batch"""
+    with alert_archive_lock:
+        alert_archive_pending_changes.append((time.time(), event, alert.id))
+
+def record_ingested_alerts(alerts):
+    """Remember everything a poll ingested (before alert_store drops cancels and superseded messages)"""
+    global alert_archive_pending_feed_ids
+    if alert_archive_thread is None:
+        return
+    with alert_archive_lock:
+        alert_archive_pending_alerts.extend(alerts)
+        alert_archive_pending_feed_ids = [alert.id for alert in alerts]
+
+def archive_alert_snapshot(warnings, score_data):
+    """Queue one batch for the archive: newly seen alerts, pending lifecycle changes and the ingested IDs"""
+    global alert_archive_last_ids, alert_archive_pending_feed_ids
+    if alert_archive_thread is None:
+        return
+    with alert_archive_lock:
+        changes = alert_archive_pending_changes[:]
+        alert_archive_pending_changes.clear()
+        ingested = alert_archive_pending_alerts[:]
+        alert_archive_pending_alerts.clear()
+        feed_ids = alert_archive_pending_feed_ids
+        alert_archive_pending_feed_ids = None
+    
+    new_alerts = {}
+    for alert in ingested + list(warnings):
+        if alert.id not in alert_archive_known_ids and alert.id not in new_alerts:
+            new_alerts[alert.id] = alert
+    new_alerts = list(new_alerts.values())
+    alert_archive_known_ids.update(alert.id for alert in new_alerts)
+    
+    snapshot = None
+    if feed_ids is not None and feed_ids != alert_archive_last_ids:
+        alert_archive_last_ids = feed_ids
+        snapshot = (time.time(), json.dumps(feed_ids), score_data["total_score"] if score_data else None)
+    
+    if new_alerts or changes or snapshot:
+        alert_archive_queue.put((new_alerts, changes, snapshot))
+
+def write_alert_archive_batch(conn, new_alerts, changes, snapshot):
+    """Write one poll's batch in a single transaction"""
+    with conn:
+        for alert in new_alerts:
+            feature = zlib.compress(json.dumps(alert.to_feature()).encode('utf-8'))
+            conn.execute(
+                "INSERT OR IGNORE INTO alerts (id, event, sent, expires, feature) VALUES (?, ?, ?, ?, ?)",
+                (alert.id, alert.event, alert.sent, alert.expires, feature)
+            )
+            states = {code[:2] for code in alert.geocode.get('UGC', [])}
+            conn.executemany(
+                "INSERT OR IGNORE INTO alert_states (alert_id, state) VALUES (?, ?)",
+                [(alert.id, state) for state in states]
+            )
+        conn.executemany("INSERT INTO lifecycle (time, event, alert_id) VALUES (?, ?, ?)", changes)
+        if snapshot:
+            conn.execute("INSERT INTO snapshots (time, alert_ids, score) VALUES (?, ?, ?)", snapshot)
+
+def alert_archive_worker():
+    """Drain queued batches into the archive database until told to stop"""
+    archive_path = os.path.join(os.path.dirname(__file__) or '.', CONFIG["ALERT_ARCHIVE_PATH"])
+    conn = sqlite3.connect(archive_path)
+    try:
+        conn.executescript(ALERT_ARCHIVE_SCHEMA)
+        known_ids = {row[0] for row in conn.execute("SELECT id FROM alerts")}
+        alert_archive_known_ids.update(known_ids)
+        logger.info(f"Alert archive open at {archive_path} ({len(known_ids)} alerts)")
+        
+        while True:
+            batch = alert_archive_queue.get()
+            if batch is None:
+                break
+            try:
+                write_alert_archive_batch(conn, *batch)
+            except Exception as e:
+                logger.error(f"Failed to write alert archive batch: {e}")
+    except Exception as e:
+        logger.error(f"Alert archive stopped: {e}", exc_info=True)
+    finally:
+        conn.close()
+
+def start_alert_archive():
+    """Open the archive and start its writer thread (no-op when archiving is disabled or alerts aren't live)"""
+    global alert_archive_thread
+    if not CONFIG["ALERT_ARCHIVE_ENABLED"] or alert_archive_thread is not None:
+        return
+    if alert_source.name != "nws":
+        # Replays and load tests would write re-timed or fake alerts into the real history
+        logger.info(f"Alert archive disabled for the '{alert_source.name}' alert source")
+        return
+    alert_store.subscribe(record_alert_change)
+    alert_archive_thread = threading.Thread(target=alert_archive_worker, name="AlertArchive", daemon=True)
+    alert_archive_thread.start()
+
+def stop_alert_archive():
+    """Flush queued batches and close the archive"""
+    global alert_archive_thread
+    if alert_archive_thread is None:
+        return
+    alert_archive_queue.put(None)
+    alert_archive_thread.join(timeout=5)
+    alert_archive_thread = None
+
+# ========================================================================================
+# --- POPULATION ENRICHMENT ---
+# ========================================================================================
+# Population lookups can wait on Nominatim, so they run on a worker as alerts are ingested.
+# The infobox never waits: it shows a placeholder and is rewritten when the result lands.
+POPULATION_URGENT = 0      # The infobox is waiting on this alert
+POPULATION_BACKGROUND = 1  # Newly ingested alert
+
+population_queue = queue.PriorityQueue()
+population_sequence = itertools.count()  # Keeps FIFO order within a priority
+population_pending = set()
+population_pending_lock = threading.Lock()
+population_worker_thread = None
+
+def request_population(alert, urgent=False):
+    """Queue a background population lookup (ingest requests are deduplicated per alert ID)"""
+    with population_pending_lock:
+        if alert.id in population_pending and not urgent:
+            return
+        population_pending.add(alert.id)
+    priority = POPULATION_URGENT if urgent else POPULATION_BACKGROUND
+    population_queue.put((priority, next(population_sequence), alert))
+
+def enrich_population_on_change(event, alert):
+    """alert_store subscriber: look up population for every alert as soon as it is ingested"""
+    if event in ("new", "updated"):
+        request_population(alert)
+
+def get_infobox_population(alert):
+    """Population if already known, else None after queueing an urgent lookup (inline when the worker isn't running)"""
+    if population_worker_thread is None:
+        return get_warning_population(alert)
+    population = alert_analysis_cache.peek(alert.id, alert.description, "population")
+    if population is None:
+        request_population(alert, urgent=True)
+    return population
+
+def population_worker():
+    """Resolve queued population lookups and patch the infobox if it is showing that alert"""
+    logger.info("Population worker started")
+    while True:
+        _, _, alert = population_queue.get()
+        if alert is None:
+            break
+        try:
+            population = get_warning_population(alert)  # Memoized, so repeat requests are free
+            logger.debug(f"Population for {alert.id}: {population:,}")
+            with infobox_lock:
+                if infobox_alert is not None and infobox_alert.id == alert.id:
+                    write_infobox_data(infobox_alert)
+        except Exception as e:
+            logger.error(f"Population enrichment failed for {alert.id}: {e}")
+        finally:
+            with population_pending_lock:
+                population_pending.discard(alert.id)
+    logger.info("Population worker stopped")
+
+def start_population_worker():
+    """Start enriching ingested alerts with population in the background"""
+    global population_worker_thread
+    if population_worker_thread is not None:
+        return
+    alert_store.subscribe(enrich_population_on_change)
+    population_worker_thread = threading.Thread(target=population_worker, name="PopulationWorker", daemon=True)
+    population_worker_thread.start()
+    # Alerts already in the store (e.g. ingested before the worker started)
+    for alert in alert_store.ordered():
+        request_population(alert)
+
+def stop_population_worker():
+    """Stop the population worker, abandoning queued lookups"""
+    global population_worker_thread
+    if population_worker_thread is None:
+        return
+    population_queue.put((-1, -1, None))
+    population_worker_thread.join(timeout=5)
+    population_worker_thread = None
+
+# ========================================================================================
+# --- BACKGROUND ALERT FETCHER ---
+# ========================================================================================
+# The worker owns alert_store; the main loop only ever sees the published snapshots
+alert_snapshot_queue = queue.Queue(maxsize=1)
+alert_snapshot_ready = threading.Event()
+alert_fetcher_stop = threading.Event()
+alert_fetcher_thread = None
+
+def poll_alerts_once():
+    """Fetch, merge and score warnings, returning a snapshot for the main loop"""
+    cleanup_old_warnings()
+    current_warnings = get_and_sort_active_warnings()
+    
+    if current_warnings is None:
+        staleness = get_nws_staleness()
+        if staleness is not None and staleness <= CONFIG["NWS_STALE_LIMIT_SECONDS"]:
+            # Keep serving the last good warnings (expiry is still applied above) instead of thrashing modes
+            logger.warning(f"NWS unavailable, serving last known warnings ({staleness:.0f}s old)")
+        else:
+            logger.error("NWS unavailable and no recent data, clearing warnings")
+            current_warnings = []
+    
+    if current_warnings is not None:
+        record_ingested_alerts(current_warnings)
+    changes = alert_store.apply(current_warnings) if current_warnings is not None else []
+    return build_alert_snapshot(changes)
+
+def build_alert_snapshot(changes):
+    """Score the store's current warnings and package them for the main loop"""
+    warnings = alert_store.ordered()
+    
+    # Calculate and write weather activity score
+    score_data = write_weather_activity_score(warnings)
+    archive_alert_snapshot(warnings, score_data)
+    
+    return {
+        "warnings": warnings,
+        "changes": changes,
+        "score": score_data,
+        "timestamp": time.time()
+    }
+
+MAX_QUIET_POLL_STREAK = 20
+
+def get_next_poll_interval(snapshot):
+    """Pick the delay before the next poll from activity level, NWS cache headers and jitter"""
+    global quiet_poll_streak
+    base = CONFIG["POLLING_INTERVAL_SECONDS"]
+    if not CONFIG["ADAPTIVE_POLLING"] or snapshot is None:
+        return base
+    
+    min_interval = CONFIG["POLL_INTERVAL_MIN_SECONDS"]
+    max_interval = CONFIG["POLL_INTERVAL_MAX_SECONDS"]
+    warnings = snapshot["warnings"]
+    score = snapshot["score"]["total_score"] if snapshot["score"] else 0
+    
+    if warnings:
+        quiet_poll_streak = 0
+    else:
+        # 1.5 ** 20 is far past any sane max interval; stop counting so the backoff can't overflow
+        quiet_poll_streak = min(quiet_poll_streak + 1, MAX_QUIET_POLL_STREAK)
+    
+    if any(w.event == "Tornado Warning" for w in warnings):
+        interval = min_interval
+    elif score >= CONFIG["POLL_ACTIVE_SCORE_THRESHOLD"]:
+        interval = base / 2
+    elif warnings:
+        interval = base
+    else:
+        # Back off by 50% per consecutive quiet poll
+        interval = min(base * (1.5 ** min(quiet_poll_streak, MAX_QUIET_POLL_STREAK)), max_interval)
+    
+    # Jitter before the limits so it can't push the delay outside them
+    jitter = CONFIG["POLL_JITTER_FRACTION"]
+    interval *= random.uniform(1 - jitter, 1 + jitter)
+    
+    # Polling before NWS refreshes its cached response only returns the same data
+    interval = max(interval, nws_fresh_until - time.time())
+    
+    return min(max(interval, min_interval), max_interval)
+
+def publish_alert_snapshot(snapshot):
+    """Hand a snapshot to the main loop, replacing any snapshot it has not picked up yet"""
+    while True:
+        try:
+            alert_snapshot_queue.put_nowait(snapshot)
+            break
+        except queue.Full:
+            try:
+                alert_snapshot_queue.get_nowait()
+            except queue.Empty:
+                pass
+    alert_snapshot_ready.set()
+
+def get_latest_alert_snapshot():
+    """Return the newest unread snapshot, or None if nothing new was published"""
+    alert_snapshot_ready.clear()
+    try:
+        return alert_snapshot_queue.get_nowait()
+    except queue.Empty:
+        return None
+
+def wait_for_alert_snapshot(timeout):
+    """Sleep until the worker publishes a snapshot or the timeout passes"""
+    return alert_snapshot_ready.wait(timeout)
+
+def alert_fetcher_worker():
+    """Poll NWS on its own schedule so detection never waits on UI automation"""
+    logger.info("Alert fetcher started")
+    while not alert_fetcher_stop.is_set():
+        snapshot = None
+        try:
+            snapshot = poll_alerts_once()
+            publish_alert_snapshot(snapshot)
+            
+            new_tornadoes = [a for event, a in snapshot["changes"] if event == "new" and a.event == "Tornado Warning"]
+            if new_tornadoes:
+                logger.warning(f"ALERT: {len(new_tornadoes)} new Tornado Warning(s) detected")
+        except Exception as e:
+            logger.error(f"Error in alert fetcher: {e}", exc_info=True)
+        
+        try:
+            interval = get_next_poll_interval(snapshot)
+        except Exception as e:
+            # A scheduling bug must never end polling
+            logger.error(f"Error picking next poll interval: {e}", exc_info=True)
+            interval = CONFIG["POLLING_INTERVAL_SECONDS"]
+        logger.debug(f"Next NWS poll in {interval:.1f}s")
+        wait_for_next_poll(time.time() + interval)
+    logger.info("Alert fetcher stopped")
+
+def wait_for_next_poll(next_poll):
+    """Sleep until the next poll, waking exactly when a warning expires to drop it and republish"""
+    while not alert_fetcher_stop.is_set():
+        now = time.time()
+        if now >= next_poll:
+            return
+        next_expiry = alert_store.next_expiry()
+        wake_at = min(next_poll, next_expiry) if next_expiry is not None else next_poll
+        if alert_fetcher_stop.wait(max(wake_at - now, 0)):
+            return
+        try:
+            if expired := alert_store.remove_expired():
+                logger.info(f"{len(expired)} warning(s) expired")
+                publish_alert_snapshot(build_alert_snapshot([("expired", a) for a in expired]))
+        except Exception as e:
+            logger.error(f"Error expiring warnings: {e}", exc_info=True)
+
+def start_alert_fetcher():
+    """Start the background alert fetcher thread"""
+    global alert_fetcher_thread
+    alert_fetcher_stop.clear()
+    alert_fetcher_thread = threading.Thread(target=alert_fetcher_worker, name="AlertFetcher", daemon=True)
+    alert_fetcher_thread.start()
+
+def stop_alert_fetcher():
+    """Signal the background alert fetcher to stop and wait briefly for it"""
+    alert_fetcher_stop.set()
+    if alert_fetcher_thread and alert_fetcher_thread.is_alive():
+        alert_fetcher_thread.join(timeout=5)
 
 # ========================================================================================
 # --- HIGH-LEVEL NAVIGATION LOGIC ---
 # ========================================================================================
-def navigate_to_warning(warning_feature):
+def navigate_to_warning(alert):
     """Navigate to a warning location and display its information"""
     global last_action_timestamp, current_city
     
@@ -1504,9 +3216,9 @@ def navigate_to_warning(warning_feature):
         logger.error(f"ERROR hiding warning box: {e}")
     
     # Show warning info
-    write_infobox_data(warning_feature)
+    write_infobox_data(alert)
     
-    area_desc = warning_feature['properties'].get('areaDesc', "United States")
+    area_desc = alert.area_desc if alert.area_desc != 'N/A' else "United States"
     
     # Parse the area description to get county and state
     parts = area_desc.split(';')[0].strip().split(',')
@@ -1630,19 +3342,24 @@ def main_loop():
     if state := load_state():
         globals().update({k: v for k, v in state.items() if k in globals()})
     
+    start_alert_archive()
+    start_population_worker()
+    use_fetcher = CONFIG["BACKGROUND_ALERT_FETCHER"]
+    if use_fetcher:
+        start_alert_fetcher()
+        # Don't start touring cities before the first poll has had a chance to report warnings
+        wait_for_alert_snapshot(30)
+    
     while True:
         try:
             logger.info(f"\n{'='*50}\nMode: {current_mode.upper()}")
             
             # --- Mode Switching Logic ---
-            cleanup_old_warnings()
-            current_warnings = get_and_sort_active_warnings()
-            active_warnings_cache = merge_new_warnings(current_warnings, active_warnings_cache)
+            snapshot = get_latest_alert_snapshot() if use_fetcher else poll_alerts_once()
+            if snapshot is not None:
+                active_warnings_cache = snapshot["warnings"]
             has_warnings = bool(active_warnings_cache)
 
-            # Calculate and write weather activity score
-            write_weather_activity_score(active_warnings_cache)
-
             # Switch to warnings mode if there are any warnings
             if has_warnings and current_mode != "warnings":
                 logger.info("--> Warnings are present. Switching to WARNINGS mode.")
@@ -1699,8 +3416,7 @@ def main_loop():
                     if new_high_priority:
                         # Find the first tornado warning and jump to it
                         for i, warning in enumerate(active_warnings_cache):
-                            props = warning.get('properties', {})
-                            if props.get('event') == "Tornado Warning":
+                            if warning.event == "Tornado Warning":
                                 warning_display_index = i
                                 logger.info(f"Jumping to new tornado warning at index {i}")
                                 break
@@ -1708,8 +3424,8 @@ def main_loop():
                     # Show the current warning
                     warning_index = warning_display_index % len(active_warnings_cache)
                     current_warning = active_warnings_cache[warning_index]
-                    warning_type = current_warning['properties']['event']
-                    is_pds = is_pds_warning(current_warning)
+                    warning_type = current_warning.event
+                    is_pds = current_warning.is_pds
 
                     logger.info(f"Showing warning {warning_index + 1}/{len(active_warnings_cache)}: {warning_type}{' (PDS)' if is_pds else ''}")
 
@@ -1724,7 +3440,10 @@ def main_loop():
                             logger.info("Completed full warning cycle, restarting from beginning")
             
             save_state()
-            time.sleep(CONFIG["POLLING_INTERVAL_SECONDS"])
+            if use_fetcher:
+                wait_for_alert_snapshot(CONFIG["POLLING_INTERVAL_SECONDS"])
+            else:
+                time.sleep(CONFIG["POLLING_INTERVAL_SECONDS"])
             
         except Exception as e:
             logger.error(f"Error occurred in cycle: {e}", exc_info=True)
@@ -1736,6 +3455,9 @@ def shutdown(signal_received=None, frame=None):
         logger.info(f"\nReceived exit signal {signal_received}...")
     
     logger.info("Shutting down...")
+    stop_alert_fetcher()
+    stop_alert_archive()
+    stop_population_worker()
     hide_all_weather_displays()
     save_state()
     